@@ -1,3 +1,42 @@
 __version__ = "0.0.1"
 
-from .coordinate_system import Vector, Coordinate, Direction, LazyCoordinateSystem
+import importlib
+
+# Imported eagerly, as it is light, and as importing the `render` submodule later on would
+# otherwise shadow its `render` function
+from .render import Viewport, render, export_image
+
+# The public names and the modules defining them. The modules are imported upon the first access
+# of one of their names, so that importing the package, or any light submodule such as `search`
+# or `runner`, does not pay for importing NumPy
+_EXPORTS = {
+    'Vector': 'coordinate_system',
+    'Coordinate': 'coordinate_system',
+    'Direction': 'coordinate_system',
+    'LazyCoordinateSystem': 'coordinate_system',
+    'Stencil': 'coordinate_system',
+    'VectorArray': 'vector_array',
+    'IntervalSet': 'interval_set',
+    'line_keys': 'shapes',
+    'diamond_spans': 'shapes',
+    'rect_spans': 'shapes',
+    'polyline_spans': 'shapes',
+    'CharGrid': 'char_grid',
+    'load_char_grid': 'char_grid',
+    'Checkpointer': 'checkpoint',
+}
+
+__all__ = ['Viewport', 'render', 'export_image', *_EXPORTS]
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+
+    # Cache the name, so that `__getattr__` is only ever called once per name
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,263 @@
+"""The command line interface of ``advent_support``, run as ``python -m advent_support``."""
+import argparse
+import json
+import os
+import sys
+
+from . import batch, bench, daemon, generators, importtime, memory, parse_cache, profiling, result_cache, runner
+
+def add_run_parser(subparsers):
+    parser = subparsers.add_parser('run', help="Run and time a day's solution")
+    parser.add_argument('day', type=int, help="The day to run")
+    parser.add_argument('--input', metavar='PATH', help="The puzzle input, defaulting to the day's input.txt")
+    parser.add_argument('--part', type=int, choices=runner.PARTS, help="Run only this part")
+    parser.add_argument('--repeat', type=int, default=1, metavar='N',
+                        help="Run N times, bypassing the result cache, reporting the fastest time of each phase")
+    parser.add_argument('--root', default='.', help="The directory holding the dayN directories")
+    parser.add_argument('--format', choices=('text', 'json'), default='text',
+                        help="Print text or JSON lines")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Bypass the result and parse caches, always running the solution on the text input")
+    parser.add_argument('--no-result-cache', action='store_true',
+                        help="Bypass only the result cache, always running the solution")
+    parser.add_argument('--no-parse-cache', action='store_true',
+                        help="Bypass only the parse cache, always parsing the text input")
+    parser.add_argument('--cache-dir', default=result_cache.DEFAULT_DIR, metavar='DIR',
+                        help="The directory of the result cache, holding the parse cache in DIR/parsed")
+    parser.add_argument('--cache-size', type=int, default=result_cache.DEFAULT_MAX_BYTES, metavar='BYTES',
+                        help="Evict the least recently used results, and parsed inputs, beyond this size")
+    parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                        help="Run once, bypassing the caches, and save a cProfile profile and collapsed stacks "
+                             "of every phase to DIR, 'profiles' by default")
+    parser.add_argument('--memory', action='store_true',
+                        help="Run once, bypassing the caches, and report the memory allocated by every phase")
+    parser.add_argument('--memory-budgets', default=memory.DEFAULT_BUDGETS, metavar='PATH',
+                        help="The JSON budgets of the peak bytes of every phase, enforced with --memory")
+    parser.add_argument('--top', type=int, default=5, metavar='N',
+                        help="List the N source lines allocating the most memory, with --memory")
+    parser.set_defaults(handler=run_command)
+
+def run_command(args):
+    parts = runner.PARTS if args.part is None else (args.part,)
+    if args.profile is not None:
+        module = runner.load_solution(args.day, root=args.root)
+        input_path = runner.default_input(module) if args.input is None else args.input
+
+        results = profiling.profile_solution(module, args.day, input_path, parts=parts, output_dir=args.profile)
+        runner.print_results(results, fmt=args.format)
+        print(f"Saved the profiles to {args.profile}", file=sys.stderr)
+        return 0
+
+    if args.memory:
+        module = runner.load_solution(args.day, root=args.root)
+        input_path = runner.default_input(module) if args.input is None else args.input
+
+        results = memory.memory_solution(module, args.day, input_path, parts=parts, top=args.top)
+        formatter = memory.format_json if args.format == 'json' else memory.format_text
+        for result in results:
+            print(formatter(result))
+
+        over = memory.find_over_budget(results, memory.load_budgets(args.memory_budgets))
+        for o in over:
+            print(f"OVER BUDGET day{o.day} {o.phase}: {o.peak} bytes > {o.budget} bytes", file=sys.stderr)
+        return 1 if over else 0
+
+    if args.no_cache or args.no_result_cache:
+        cache = None
+    else:
+        cache = result_cache.ResultCache(args.cache_dir, max_bytes=args.cache_size)
+    if args.no_cache or args.no_parse_cache:
+        parsed_cache = None
+    else:
+        parsed_cache = parse_cache.ParseCache(os.path.join(args.cache_dir, 'parsed'), max_bytes=args.cache_size)
+
+    results = runner.run_day(args.day, input_path=args.input, root=args.root, parts=parts,
+                             repeat=args.repeat, cache=cache, parse_cache=parsed_cache)
+    runner.print_results(results, fmt=args.format)
+    return 0
+
+def add_bench_parser(subparsers):
+    parser = subparsers.add_parser('bench', help="Benchmark the solutions against a stored baseline")
+    parser.add_argument('days', type=int, nargs='*', help="The days to benchmark, defaulting to every day")
+    parser.add_argument('--input-dir', metavar='DIR',
+                        help="Read the input of day N from DIR/dayN.txt, rather than the day's input.txt")
+    parser.add_argument('--warmup', type=int, default=1, metavar='N', help="Untimed runs before timing")
+    parser.add_argument('--repeat', type=int, default=10, metavar='N', help="Timed runs of every phase")
+    parser.add_argument('--baseline', default=bench.DEFAULT_BASELINE, metavar='PATH',
+                        help="The JSON baseline to compare against")
+    parser.add_argument('--threshold', type=float, default=bench.DEFAULT_THRESHOLD,
+                        help="The relative slowdown of a phase's median flagged as a regression")
+    parser.add_argument('--save', action='store_true', help="Record the results as the new baseline")
+    parser.add_argument('--root', default='.', help="The directory holding the dayN directories")
+    parser.set_defaults(handler=bench_command)
+
+def bench_command(args):
+    baseline = bench.load_baseline(args.baseline)
+
+    results = {}
+    for day in args.days or runner.available_days(args.root):
+        module = runner.load_solution(day, root=args.root)
+        if args.input_dir is None:
+            input_path = runner.default_input(module)
+        else:
+            input_path = os.path.join(args.input_dir, f"day{day}.txt")
+
+        if not os.path.exists(input_path):
+            print(f"day{day}: skipped, no input at {input_path}", file=sys.stderr)
+            continue
+
+        key = f"day{day}"
+        results[key] = bench.bench_solution(module, input_path, warmup=args.warmup, repeat=args.repeat)
+        for phase, stats in results[key].items():
+            print(bench.format_stats(key, phase, stats, baseline.get(key, {}).get(phase)))
+
+    if args.save:
+        bench.save_baseline(args.baseline, results)
+        print(f"Saved the baseline to {args.baseline}")
+        return 0
+
+    regressions = bench.find_regressions(results, baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION day{regression.day} {regression.phase}: "
+              f"{regression.baseline * 1000:.3f} ms -> {regression.current * 1000:.3f} ms "
+              f"({regression.slowdown:+.1%})", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+def add_generate_parser(subparsers):
+    parser = subparsers.add_parser('generate', help="Generate synthetic puzzle inputs")
+    parser.add_argument('days', type=int, nargs='+', choices=sorted(generators.GENERATORS),
+                        metavar='DAY', help="The days to generate inputs of")
+    parser.add_argument('--seed', type=int, default=0, help="The random seed")
+    parser.add_argument('--scale', type=float, default=1,
+                        help="The size relative to a real puzzle input")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--output', metavar='PATH', help="Write the input of a single day to PATH")
+    output.add_argument('--output-dir', metavar='DIR', help="Write the input of day N to DIR/dayN.txt")
+    parser.set_defaults(handler=generate_command)
+
+def generate_command(args):
+    if args.output is not None:
+        if len(args.days) != 1:
+            raise SystemExit("error: --output takes a single day, use --output-dir for several")
+        generators.generate_file(args.days[0], args.output, seed=args.seed, scale=args.scale)
+    elif args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for day in args.days:
+            path = os.path.join(args.output_dir, f"day{day}.txt")
+            generators.generate_file(day, path, seed=args.seed, scale=args.scale)
+    else:
+        for day in args.days:
+            generators.generate(day, sys.stdout, seed=args.seed, scale=args.scale)
+    return 0
+
+def add_batch_parser(subparsers):
+    parser = subparsers.add_parser('batch', help="Solve many inputs of a day over a process pool")
+    parser.add_argument('day', type=int, help="The day to solve")
+    parser.add_argument('inputs', nargs='+', metavar='INPUT',
+                        help="Directories of inputs or glob patterns of input files")
+    parser.add_argument('--part', type=int, choices=runner.PARTS, help="Run only this part")
+    parser.add_argument('--workers', type=int, help="The number of worker processes, one per CPU by default")
+    parser.add_argument('--max-in-flight', type=int, metavar='N',
+                        help="The most inputs submitted at once, twice the workers by default")
+    parser.add_argument('--root', default='.', help="The directory holding the dayN directories")
+    parser.set_defaults(handler=batch_command)
+
+def batch_command(args):
+    parts = runner.PARTS if args.part is None else (args.part,)
+    records = batch.solve_batch(args.day, batch.expand_inputs(args.inputs), root=args.root, parts=parts,
+                                workers=args.workers, max_in_flight=args.max_in_flight)
+
+    n_errors = 0
+    for record in records:
+        n_errors += 'error' in record
+        print(json.dumps(record), flush=True)
+
+    return 1 if n_errors else 0
+
+def add_serve_parser(subparsers):
+    parser = subparsers.add_parser('serve', help="Serve solve requests from a warm daemon over a Unix socket")
+    parser.add_argument('--socket', default=daemon.DEFAULT_SOCKET, metavar='PATH', help="The socket to listen on")
+    parser.add_argument('--root', default='.', help="The directory holding the dayN directories")
+    parser.set_defaults(handler=serve_command)
+
+def serve_command(args):
+    daemon.remove_stale_socket(args.socket)
+    print(f"Serving at {args.socket}", file=sys.stderr, flush=True)
+    daemon.serve(args.socket, root=args.root)
+    return 0
+
+def add_solve_parser(subparsers):
+    parser = subparsers.add_parser('solve', help="Solve inputs with a running daemon")
+    parser.add_argument('day', type=int, help="The day to solve")
+    parser.add_argument('inputs', nargs='*', metavar='INPUT',
+                        help="The input files, '-' for standard input, defaulting to the day's input.txt")
+    parser.add_argument('--part', type=int, choices=runner.PARTS, help="Run only this part")
+    parser.add_argument('--socket', default=daemon.DEFAULT_SOCKET, metavar='PATH', help="The daemon's socket")
+    parser.add_argument('--format', choices=('text', 'json'), default='text',
+                        help="Print text or JSON lines")
+    parser.set_defaults(handler=solve_command)
+
+def solve_command(args):
+    requests = []
+    for input_path in args.inputs or [None]:
+        req = {'day': args.day, 'part': args.part}
+        if input_path == '-':
+            req['input_text'] = sys.stdin.read()
+        elif input_path is not None:
+            req['input'] = os.path.abspath(input_path)
+        requests.append(req)
+
+    n_errors = 0
+    for record in daemon.request(requests, socket_path=args.socket):
+        if 'error' in record:
+            n_errors += 1
+            print(f"error: {record['error']}", file=sys.stderr)
+        elif args.format == 'json':
+            print(json.dumps(record), flush=True)
+        else:
+            runner.print_results(daemon.record_results(record))
+
+    return 1 if n_errors else 0
+
+def add_importtime_parser(subparsers):
+    parser = subparsers.add_parser('importtime', help="Measure the start-up import cost of the solutions")
+    parser.add_argument('days', type=int, nargs='*', help="The days to measure, defaulting to every day")
+    parser.add_argument('--budget', type=float, default=importtime.DEFAULT_BUDGET * 1000, metavar='MS',
+                        help="Fail when the imports of a solution take longer than this")
+    parser.add_argument('--top', type=int, default=5, metavar='N',
+                        help="List the N costliest modules each solution imports")
+    parser.add_argument('--root', default='.', help="The directory holding the dayN directories")
+    parser.set_defaults(handler=importtime_command)
+
+def importtime_command(args):
+    n_over = 0
+    for day in args.days or runner.available_days(args.root):
+        profile = importtime.measure_imports(day, root=args.root)
+        print(importtime.format_profile(profile, top=args.top))
+
+        if profile.seconds * 1000 > args.budget:
+            n_over += 1
+            print(f"OVER BUDGET day{day}: {profile.seconds * 1000:.3f} ms > {args.budget:.3f} ms", file=sys.stderr)
+
+    return 1 if n_over else 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m advent_support", description=__doc__)
+    subparsers = parser.add_subparsers(required=True, metavar='COMMAND')
+    add_run_parser(subparsers)
+    add_bench_parser(subparsers)
+    add_generate_parser(subparsers)
+    add_batch_parser(subparsers)
+    add_serve_parser(subparsers)
+    add_solve_parser(subparsers)
+    add_importtime_parser(subparsers)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (ConnectionRefusedError, FileExistsError, FileNotFoundError) as e:
+        parser.exit(1, f"error: {e}\n")
+
+if __name__ == "__main__":
+    sys.exit(main())
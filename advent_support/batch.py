@@ -0,0 +1,84 @@
+"""Solve many independent inputs of a day over a pool of warm worker processes.
+
+Every worker imports the day's solution once, when it starts, and then solves input after input.
+Results are yielded in completion order, and at most ``max_in_flight`` inputs are submitted to the
+pool at once, so memory stays bounded however many inputs there are.
+"""
+import glob
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, Optional
+
+from . import runner
+
+# The solution module of the worker process, imported once by `_init_worker`
+_solution = None
+_day = None
+
+def _init_worker(day, root):
+    global _solution, _day
+    _solution = runner.load_solution(day, root=root)
+    _day = day
+
+def _solve(input_path, parts) -> dict:
+    """Solve a single input within a worker, reporting any failure as part of the record."""
+    record = {'day': _day, 'input': input_path}
+    try:
+        results = runner.run_solution(_solution, _day, input_path, parts=parts)
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+        return record
+
+    record.update(runner.results_record(results))
+    return record
+
+def expand_inputs(patterns: Iterable[str]) -> Iterator[str]:
+    """Yield the input files of every directory or glob pattern, each in sorted order."""
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            names = sorted(os.listdir(pattern))
+            paths = (os.path.join(pattern, name) for name in names if not name.startswith('.'))
+        else:
+            paths = sorted(glob.glob(pattern))
+
+        yield from filter(os.path.isfile, paths)
+
+def solve_batch(
+        day,
+        input_paths: Iterable[str],
+        *,
+        root='.',
+        parts=runner.PARTS,
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+) -> Iterator[dict]:
+    """Solve every input of ``input_paths`` with the solution of ``day``, yielding records as they complete.
+
+    A record holds the ``day``, the ``input`` and either the ``seconds`` and ``answers`` of its
+    phases or the ``error`` it failed with.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    max_in_flight = 2 * workers if max_in_flight is None else max_in_flight
+    if max_in_flight < 1:
+        raise ValueError(f"At least one input must be in flight, not {max_in_flight}")
+
+    # Fail early on a missing solution, rather than within every worker
+    if not os.path.exists(runner.solution_path(day, root=root)):
+        raise FileNotFoundError(f"There is no solution of day {day} at: {runner.solution_path(day, root=root)}")
+
+    input_paths = iter(input_paths)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(day, root)) as pool:
+        in_flight = set()
+        while True:
+            # Top up the in-flight work, pulling inputs lazily
+            for input_path in input_paths:
+                in_flight.add(pool.submit(_solve, input_path, tuple(parts)))
+                if len(in_flight) >= max_in_flight:
+                    break
+
+            if not in_flight:
+                break
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,115 @@
+"""Benchmark the phases of the daily solutions against a stored JSON baseline.
+
+Every phase is run a number of ``warmup`` times untimed, then timed over ``repeat`` runs, and is
+summarized by the median and 95th percentile of its wall times. A baseline file maps each day
+to the summaries of its phases::
+
+    {"day14": {"parse": {"median": 0.0012, "p95": 0.0015, "n": 10}, "part1": {...}}, ...}
+
+A phase regresses when its median exceeds the baseline median by more than a relative threshold.
+"""
+import json
+import math
+import os
+import statistics
+from typing import NamedTuple, Optional
+
+from .runner import PARTS, has_part, timed
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+
+# A phase regresses when it is this fraction slower than its baseline
+DEFAULT_THRESHOLD = 0.10
+
+class PhaseStats(NamedTuple):
+    median: float
+    p95: float
+    n: int
+
+    @classmethod
+    def of(cls, times) -> "PhaseStats":
+        ordered = sorted(times)
+
+        # The nearest-rank 95th percentile
+        p95 = ordered[math.ceil(0.95 * len(ordered)) - 1]
+        return cls(statistics.median(ordered), p95, len(ordered))
+
+class Regression(NamedTuple):
+    day: int
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.current / self.baseline - 1
+
+def bench_solution(module, input_path, *, parts=PARTS, warmup=1, repeat=10) -> dict[str, PhaseStats]:
+    """Time the parse and ``parts`` phases of the solution ``module``, after ``warmup`` untimed runs."""
+    if repeat < 1:
+        raise ValueError(f"Cannot benchmark {repeat} repetitions")
+
+    parts = [part for part in parts if has_part(module, part)]
+    times = {'parse': []}
+    times.update({f"part{part}": [] for part in parts})
+
+    for i in range(warmup + repeat):
+        puzzle, seconds = timed(module.parse, input_path)
+        phase_times = [('parse', seconds)]
+        for part in parts:
+            phase = f"part{part}"
+            _, seconds = timed(getattr(module, phase), puzzle)
+            phase_times.append((phase, seconds))
+
+        # Discard the warm-up runs, which pay for cold caches and lazy initialization
+        if i >= warmup:
+            for phase, seconds in phase_times:
+                times[phase].append(seconds)
+
+    return {phase: PhaseStats.of(phase_times) for phase, phase_times in times.items()}
+
+def load_baseline(path) -> dict:
+    """Load the baseline at ``path``, an empty baseline if there is none yet."""
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'r') as f:
+        baseline = json.load(f)
+
+    return {day: {phase: PhaseStats(**stats) for phase, stats in phases.items()}
+            for day, phases in baseline.items()}
+
+def save_baseline(path, baseline):
+    """Save the ``baseline``, replacing the phases it holds and keeping every other stored phase."""
+    stored = load_baseline(path)
+    for day, phases in baseline.items():
+        stored.setdefault(day, {}).update(phases)
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, 'w') as f:
+        json.dump({day: {phase: stats._asdict() for phase, stats in phases.items()}
+                   for day, phases in sorted(stored.items(), key=lambda item: int(item[0][3:]))},
+                  f, indent=2)
+        f.write('\n')
+
+def find_regressions(results, baseline, *, threshold=DEFAULT_THRESHOLD) -> list[Regression]:
+    """Compare the median of every phase of ``results`` to the ``baseline``.
+
+    Phases missing from the ``baseline`` are never regressions.
+    """
+    regressions = []
+    for day, phases in results.items():
+        for phase, stats in phases.items():
+            base: Optional[PhaseStats] = baseline.get(day, {}).get(phase)
+            if base is not None and stats.median > base.median * (1 + threshold):
+                regressions.append(Regression(int(day[3:]), phase, base.median, stats.median))
+
+    return regressions
+
+def format_stats(day, phase, stats, base: Optional[PhaseStats] = None) -> str:
+    line = f"{day:<6} {phase:<6} median {stats.median * 1000:>10.3f} ms  p95 {stats.p95 * 1000:>10.3f} ms"
+    if base is not None and base.median > 0:
+        line += f"  ({stats.median / base.median - 1:+.1%} vs baseline)"
+    return line
@@ -0,0 +1,84 @@
+import mmap
+
+import numpy
+
+class CharGrid():
+    """A rectangular character grid file, memory-mapped as a 2-d ``uint8`` array.
+
+    The rows of the file are viewed in place with a row stride of ``width + 1`` to step over the
+    newlines, so loading creates no per-cell Python objects. The grid is indexed as [row, col].
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            # An empty file cannot be memory-mapped
+            if f.seek(0, 2) == 0:
+                self._mmap = None
+                self.array = numpy.zeros((0, 0), dtype=numpy.uint8)
+                return
+
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buf = numpy.frombuffer(self._mmap, dtype=numpy.uint8)
+
+        # Every row is as wide as the first, with the trailing newline being optional
+        width = self._mmap.find(b'\n')
+        if width == -1:
+            width = len(buf)
+        height = (len(buf) + 1) // (width + 1)
+
+        # Sanity check that the file is a rectangular grid, with newlines exactly at every row end
+        if (len(buf) not in (height * (width + 1), height * (width + 1) - 1)
+                or not numpy.all(buf[width::width + 1] == ord('\n'))):
+            raise ValueError(f"{path} is not a rectangular grid of {width}-wide rows")
+
+        self.array = numpy.lib.stride_tricks.as_strided(
+            buf, shape=(height, width), strides=(width + 1, 1), writeable=False,
+        )
+
+        if numpy.any(self.array == ord('\n')):
+            raise ValueError(f"{path} is not a rectangular grid of {width}-wide rows")
+
+    @property
+    def shape(self):
+        """Return the (nrows, ncols) of the grid."""
+        return self.array.shape
+
+    def close(self):
+        # Drop the view of the map before closing it
+        self.array = None
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def remap(self, mapping, *, dtype=numpy.uint8):
+        """Return a copy of the grid with the characters remapped in a single vectorized pass.
+
+        The ``mapping`` maps characters to either other characters or integer values. Characters
+        not in the ``mapping`` keep their ``ord`` value.
+        """
+        lut = numpy.arange(256, dtype=dtype)
+        for char, value in mapping.items():
+            lut[ord(char)] = ord(value) if isinstance(value, str) else value
+
+        return lut[self.array]
+
+    def digits(self, *, dtype=numpy.uint8):
+        """Return a copy of the grid of digits '0'-'9' converted to their integer values."""
+        # Sanity check that every character is a digit
+        if self.array.size and not numpy.all((self.array >= ord('0')) & (self.array <= ord('9'))):
+            raise ValueError("The grid contains non-digit characters")
+
+        return (self.array - ord('0')).astype(dtype)
+
+    def find(self, char):
+        """Return the ``(row, col)`` positions of every occurrence of ``char``, in row-major order."""
+        return list(map(tuple, numpy.argwhere(self.array == ord(char)).tolist()))
+
+def load_char_grid(path) -> CharGrid:
+    return CharGrid(path)
@@ -0,0 +1,99 @@
+"""Periodic checkpoints of long-running simulations, so that a run may be resumed or extended.
+
+A simulation taking part in checkpointing implements:
+
+* ``advance() -> bool``: perform a single step, returning ``False`` once there is nothing left to do.
+* ``dump_state() -> bytes``: serialize the complete state of the simulation.
+* ``load_state(payload)``: restore the state serialized by ``dump_state`` in place.
+
+A checkpoint file holds a fixed ``HEADER`` of the magic, the number of steps performed and the
+length of the payload, followed by the payload itself. All integers are little-endian.
+"""
+import os
+import struct
+from typing import Optional, Protocol
+
+MAGIC = b"ACKP"
+
+HEADER = struct.Struct("<4sQQ")
+
+class Simulation(Protocol):
+
+    def advance(self) -> bool:
+        ...
+
+    def dump_state(self) -> bytes:
+        ...
+
+    def load_state(self, payload: bytes):
+        ...
+
+class Checkpointer():
+    """Saves the state of a simulation to ``path`` every ``every`` steps, resuming from it when present."""
+
+    def __init__(self, path, *, every=1000):
+        if every <= 0:
+            raise ValueError(f"Checkpoints must be at least every step, not every {every}")
+
+        self.path = path
+        self.every = every
+
+    def load(self) -> Optional[tuple[int, bytes]]:
+        """Return the ``(step, payload)`` of the latest checkpoint, ``None`` if there is none."""
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        magic, step, payload_len = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a checkpoint")
+
+        # Sanity check that the checkpoint was not truncated
+        payload = data[HEADER.size:]
+        if len(payload) != payload_len:
+            raise ValueError(f"{self.path} is truncated, expected {payload_len} payload bytes")
+
+        return step, payload
+
+    def save(self, step, payload: bytes):
+        """Atomically replace the latest checkpoint by the ``payload`` at ``step``."""
+        # Write aside and then rename, so that a crash never leaves a partial checkpoint behind
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, step, len(payload)))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, self.path)
+
+    def run(self, simulation: Simulation, n_steps=None) -> int:
+        """Advance the ``simulation`` up to ``n_steps`` in total, or until it finishes if ``None``.
+
+        The run resumes from the latest checkpoint if there is one, so only the steps beyond it
+        are performed. Returns the total number of steps performed, including the resumed ones.
+        """
+        step = 0
+        if (checkpoint := self.load()) is not None:
+            step, payload = checkpoint
+            if n_steps is not None and step > n_steps:
+                raise ValueError(f"The checkpoint at step {step} is already beyond {n_steps} steps")
+            simulation.load_state(payload)
+
+        saved_step = step
+        while n_steps is None or step < n_steps:
+            if not simulation.advance():
+                break
+            step += 1
+
+            if step % self.every == 0:
+                self.save(step, simulation.dump_state())
+                saved_step = step
+
+        # Always checkpoint the final state, so that a later run may extend it
+        if step != saved_step or checkpoint is None:
+            self.save(step, simulation.dump_state())
+
+        return step
@@ -1,20 +1,54 @@
 import typing
 from typing import Generic, TypeVar, Callable
 
-from dataclasses import dataclass
 from enum import Enum
 import copy
+import io
 import operator
-from itertools import starmap
+from itertools import repeat, starmap
 
 from math import sqrt
 
+from .render import render
+from .shapes import _MISSING, line_keys, diamond_spans, rect_spans, polyline_spans, merge_spans
+
+# The NumPy backed `storage` and `snapshot` modules are imported upon first use, so that
+# importing the plain dict backed coordinate system does not pay for importing NumPy
+
 T = TypeVar('T', int, float, covariant=True)
 
-@dataclass(frozen=True)
-class Vector(Generic[T]):
-    x: T
-    y: T
+class Vector(tuple, Generic[T]):
+    """An immutable 2D vector, backed by its ``(x, y)`` tuple so that no instance carries a ``__dict__``.
+
+    A ``Vector`` compares equal to any other ``Vector`` of the same components, but never to a plain
+    tuple, as its ``(x, y)`` tuple is an implementation detail.
+    """
+    __slots__ = ()
+
+    def __new__(cls, x: T, y: T):
+        return tuple.__new__(cls, (x, y))
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    x = property(operator.itemgetter(0))
+    y = property(operator.itemgetter(1))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(x={self[0]!r}, y={self[1]!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, Vector):
+            return tuple.__eq__(self, other)
+        # Answer for plain tuples, which would otherwise compare equal by their items
+        return False if isinstance(other, tuple) else NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Vector):
+            return tuple.__ne__(self, other)
+        return True if isinstance(other, tuple) else NotImplemented
+
+    __hash__ = tuple.__hash__
 
     @staticmethod
     def dunder_broadcastable(func):
@@ -53,10 +87,7 @@ class Vector(Generic[T]):
     @staticmethod
     def __truediv__() -> Callable[[T, T], T]:
         return operator.truediv
-    
-    def __iter__(self) -> tuple[T, T]:
-        return iter((self.x, self.y))
-    
+
     @property
     def length(self) -> float:
         return sqrt(self.x ** 2 + self.y ** 2)
@@ -69,6 +100,11 @@ class Vector(Generic[T]):
     def norm(self) -> "Vector[float]":
         return self / self.length
 
+    @property
+    def sign(self) -> "Vector[int]":
+        """The per-component sign, which is the unit step along horizontal, vertical and 45° lines."""
+        return self.__class__((self.x > 0) - (self.x < 0), (self.y > 0) - (self.y < 0))
+
     @property
     def orthogonal(self) -> "Vector[T]":
         return self.__class__(-1 * self.y, self.x)
@@ -77,91 +113,378 @@ class Vector(Generic[T]):
         return self.x * other.x + self.y * other.y
 
 class Coordinate(Vector[int]):
-    
+    """An integer ``Vector`` backed by a ``tuple`` for low-overhead arithmetic and hashing.
+
+    Being a ``tuple``, a ``Coordinate`` hashes and compares equal to its ``(x, y)`` tuple, so it
+    may key a dictionary directly. Operations between integer coordinates take a fast path,
+    anything else falls back onto the generic ``Vector`` operations.
+    """
+    __slots__ = ()
+
+    # A cache of frequently used `Coordinate`s, populated by `Coordinate.intern`
+    _interned: typing.ClassVar[dict[tuple[int, int], "Coordinate"]] = {}
+
+    # Unlike a `Vector`, compare equal to the plain `(x, y)` tuple
+    __eq__ = tuple.__eq__
+    __ne__ = tuple.__ne__
+    __hash__ = tuple.__hash__
+
+    @classmethod
+    def intern(cls, x, y):
+        """Return the shared ``Coordinate`` instance of ``(x, y)``, creating it on first use."""
+        coord = cls._interned.get((x, y))
+        if coord is None:
+            coord = cls._interned[(x, y)] = cls(x, y)
+        return coord
+
     @classmethod
     def from_string(cls, x, y):
         # String inputs of `y` are inverted in the problem, flip it back over
         return cls(int(x), -1 * int(y))
 
+    def __add__(self, other):
+        if isinstance(other, Coordinate):
+            return tuple.__new__(self.__class__, (self[0] + other[0], self[1] + other[1]))
+        elif type(other) is int:
+            return tuple.__new__(self.__class__, (self[0] + other, self[1] + other))
+        return Vector.__add__(self, other)
+
+    def __radd__(self, other):
+        if isinstance(other, Vector):
+            # Being a subclass, this is tried before `Vector.__add__`. Keep the left-hand type
+            return other.__class__(other.x + self[0], other.y + self[1])
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, Coordinate):
+            return tuple.__new__(self.__class__, (self[0] - other[0], self[1] - other[1]))
+        elif type(other) is int:
+            return tuple.__new__(self.__class__, (self[0] - other, self[1] - other))
+        return Vector.__sub__(self, other)
+
+    def __rsub__(self, other):
+        if isinstance(other, Vector):
+            # Being a subclass, this is tried before `Vector.__sub__`. Keep the left-hand type
+            return other.__class__(other.x - self[0], other.y - self[1])
+        elif isinstance(other, T.__constraints__):
+            return self.__class__(other - self[0], other - self[1])
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, Coordinate):
+            return tuple.__new__(self.__class__, (self[0] * other[0], self[1] * other[1]))
+        elif type(other) is int:
+            return tuple.__new__(self.__class__, (self[0] * other, self[1] * other))
+        return Vector.__mul__(self, other)
+
+    def __rmul__(self, other):
+        if isinstance(other, Vector):
+            # Being a subclass, this is tried before `Vector.__mul__`. Keep the left-hand type
+            return other.__class__(other.x * self[0], other.y * self[1])
+        return self.__mul__(other)
+
+    @property
+    def manhattan(self) -> int:
+        return abs(self[0]) + abs(self[1])
+
 class Direction(Enum):
-    N = Vector(0, 1)
-    NE = Vector(1, 1)
-    E = Vector(1, 0)
-    SE = Vector(1, -1)
-    S = Vector(0, -1)    
-    SW = Vector(-1, -1)
-    W = Vector(-1, 0)
-    NW = Vector(-1, 1)
-    STOP = Vector(0, 0)
+    N = Coordinate.intern(0, 1)
+    NE = Coordinate.intern(1, 1)
+    E = Coordinate.intern(1, 0)
+    SE = Coordinate.intern(1, -1)
+    S = Coordinate.intern(0, -1)
+    SW = Coordinate.intern(-1, -1)
+    W = Coordinate.intern(-1, 0)
+    NW = Coordinate.intern(-1, 1)
+    STOP = Coordinate.intern(0, 0)
 
     def __mul__(self, other: T | Vector[T]) -> Vector[T]:
         return self.value * other
     __rmul__ = __mul__
     
+class Stencil():
+    """A fixed neighborhood of ``(dx, dy)`` offsets around a center cell.
+
+    The offsets are resolved to plain integers once, so that querying the neighborhood of
+    any center allocates no intermediate ``Vector``s.
+    """
+
+    def __init__(self, offsets):
+        # Accept `Direction`s as well as any `Vector` or `(dx, dy)` offset
+        self.offsets = tuple(
+            tuple(o.value if isinstance(o, Direction) else o) for o in offsets
+        )
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return f"Stencil({list(self.offsets)})"
+
+# The orthogonal and the full neighborhoods, as well as the row directly below from left to right
+Stencil.NEIGHBORS_4 = Stencil([Direction.N, Direction.E, Direction.S, Direction.W])
+Stencil.NEIGHBORS_8 = Stencil([Direction.N, Direction.NE, Direction.E, Direction.SE,
+                               Direction.S, Direction.SW, Direction.W, Direction.NW])
+Stencil.BELOW = Stencil([Direction.SW, Direction.S, Direction.SE])
+
+# The types of the coordinates which key the cells as they are
+_KEY_TYPES = (tuple, Coordinate)
+
 class LazyCoordinateSystem():
 
-    def __init__(self, *, fill=None):
+    def __init__(self, *, fill=None, storage="dict", dtype=None, indexed=False):
+        """A coordinate system which only stores the cells written to it.
+
+        The ``storage`` selects the backing cell store: ``"dict"`` for arbitrary sparse
+        worlds, ``"dense"`` for compact grids which are better served by a chunk-grown
+        2-d array, or ``"tiled"`` for huge and mostly-empty worlds split into lazily allocated
+        fixed-size array tiles. The array backed stores hold values of ``dtype``, inferred
+        from ``fill`` by default. They save memory, not time: a 300x300 grid of single
+        characters takes a tenth of the memory of the ``"dict"`` store, but every access of a
+        single cell is about twice as slow, so prefer them for their span and bulk operations.
+
+        When ``indexed``, row, column and value secondary indexes are maintained upon every
+        write, enabling the ``cells_in_row``, ``cells_in_column``, ``cells_with``, ``count``
+        and ``lowest_in_column`` queries without scanning every stored cell.
+        """
         self.fill = fill
-        self.data = {}
+
+        if storage == "dict":
+            self.data = {}
+        elif storage == "dense":
+            from .storage import DenseStorage
+            self.data = DenseStorage(fill=fill, dtype=dtype)
+        elif storage == "tiled":
+            from .storage import TiledStorage
+            self.data = TiledStorage(fill=fill, dtype=dtype)
+        else:
+            raise ValueError(f"Unknown storage: {storage}")
 
         # Record the min and max values encountered for nice pretty-printing
         self.min_x = self.max_x = self.min_y = self.max_y = None
 
+        # The secondary indexes: y -> x-set, x -> y-set and value -> (x, y)-set
+        self.indexed = indexed
+        self._row_index = {}
+        self._column_index = {}
+        self._value_index = {}
+
     def __getitem__(self, coord):
         if isinstance(coord, slice):
-            vector = coord.stop - coord.start
-            norm_vector = vector.norm
-            
-            ret = []
-            c = coord.start
-            # While the iterations are still progressing in the `norm_vector` direction
-            while (coord.stop - c).dot(norm_vector) > 0:
-                ret.append(self[c])
-                c += coord.step or norm_vector
-            return ret
+            return self.get_line(coord.start, coord.stop, coord.step)
         else:
-            return self.data.get(tuple(coord), self.fill)
+            # A `Coordinate` equals its plain tuple, so it keys the `data` directly. Any other
+            # `Vector` never equals a plain tuple, so it is converted like any other iterable
+            key = coord if type(coord) in _KEY_TYPES else tuple(coord)
+            return self.data.get(key, self.fill)
 
     def __setitem__(self, coord, value):
         if isinstance(coord, slice):
-            vector = coord.stop - coord.start
-            norm_vector = vector.norm
-
-            c = coord.start
-            # While the iterations are still progressing in the `norm_vector` direction
-            while (coord.stop - c).dot(norm_vector) > 0:
-                self[c] = value
-                c += coord.step or norm_vector
+            self.set_line(coord.start, coord.stop, value, coord.step)
         else:
-            self.data[tuple(coord)] = value
+            key = coord if type(coord) in _KEY_TYPES else tuple(coord)
+            if self.indexed:
+                self._update_indexes(key, value)
 
-            # Update the min/max values encountered if warranted
-            self.min_x = min(filter(lambda c: c is not None, [self.min_x, coord.x]), default=None)
-            self.min_y = min(filter(lambda c: c is not None, [self.min_y, coord.y]), default=None)
-            self.max_x = max(filter(lambda c: c is not None, [self.max_x, coord.x]), default=None)
-            self.max_y = max(filter(lambda c: c is not None, [self.max_y, coord.y]), default=None)        
+            self.data[key] = value
+            self._update_bounds(*key)
 
-    def __str__(self):
+    def get_line(self, start, stop, step=None):
+        """Return the values along the line from ``start`` up to, but excluding, ``stop``.
+
+        See ``line_keys`` for the supported lines and ``step``s.
+        """
+        get, fill = self.data.get, self.fill
+        return [get(key, fill) for key in line_keys(start, stop, step)]
+
+    def neighbors(self, coord, stencil=Stencil.NEIGHBORS_8):
+        """Return the values of the cells of ``stencil`` centered at ``coord``, in stencil order."""
+        if not isinstance(stencil, Stencil):
+            stencil = Stencil(stencil)
+
+        x, y = coord
+        get, fill = self.data.get, self.fill
+        return [get((x + dx, y + dy), fill) for dx, dy in stencil.offsets]
+
+    def neighbors_many(self, coords, stencil=Stencil.NEIGHBORS_8):
+        """Return the ``neighbors`` of every center in ``coords``, a ``VectorArray`` or any iterable."""
+        if not isinstance(stencil, Stencil):
+            stencil = Stencil(stencil)
+
+        # Unpack a `VectorArray` of centers in bulk
+        if hasattr(coords, 'x') and hasattr(coords.x, 'tolist'):
+            coords = zip(coords.x.tolist(), coords.y.tolist())
+
+        get, fill, offsets = self.data.get, self.fill, stencil.offsets
+        return [[get((x + dx, y + dy), fill) for dx, dy in offsets] for x, y in coords]
+
+    def set_line(self, start, stop, value, step=None):
+        """Set ``value`` along the line from ``start`` up to, but excluding, ``stop``.
+
+        See ``line_keys`` for the supported lines and ``step``s.
+        """
+        keys = line_keys(start, stop, step)
+        if not keys:
+            return
+
+        data = self.data
+        for key in keys:
+            if self.indexed:
+                self._update_indexes(key, value)
+            data[key] = value
+
+        # The extremes of a straight line are its end points
+        self._update_bounds(*keys[0])
+        self._update_bounds(*keys[-1])
+
+    def fill_spans(self, spans, value):
+        """Set ``value`` to every cell of the row ``spans``, writing each span in one shot."""
+        data = self.data
+        for y, x_start, x_stop in spans:
+            if x_start >= x_stop:
+                continue
+
+            if self.indexed:
+                # The secondary indexes are maintained cell by cell
+                for x in range(x_start, x_stop):
+                    self._update_indexes((x, y), value)
+                    data[(x, y)] = value
+            elif isinstance(data, dict):
+                data.update(zip(zip(range(x_start, x_stop), repeat(y)), repeat(value)))
+            else:
+                data.set_span(y, x_start, x_stop, value)
+
+            # The extremes of a span are its end cells
+            self._update_bounds(x_start, y)
+            self._update_bounds(x_stop - 1, y)
+
+    def fill_diamond(self, center, radius, value):
+        """Set ``value`` to every cell within Manhattan distance ``radius`` of ``center``."""
+        self.fill_spans(diamond_spans(center, radius), value)
+
+    def fill_rect(self, corner, opposite, value):
+        """Set ``value`` to every cell of the rectangle between ``corner`` and ``opposite`` inclusive."""
+        self.fill_spans(rect_spans(corner, opposite), value)
+
+    def fill_polyline(self, points, value):
+        """Set ``value`` along the horizontal, vertical or diagonal segments joining ``points`` inclusive."""
+        self.fill_spans(polyline_spans(points), value)
+
+    def count_in_shape(self, spans, value=_MISSING):
+        """Count the stored cells within the row ``spans``, optionally only those of ``value``.
+
+        The ``spans`` may be any of the ``advent_support.shapes`` span generators. Every storage
+        counts alike:
+
+        >>> for storage in ("dict", "dense", "tiled"):
+        ...     cs = LazyCoordinateSystem(fill=0, storage=storage)
+        ...     cs.fill_diamond((0, 0), 3, 1)
+        ...     cs[(0, 0)] = 2
+        ...     print(storage, cs.count_in_shape(diamond_spans((0, 0), 3)),
+        ...           cs.count_in_shape(diamond_spans((0, 0), 3), 1))
+        dict 25 24
+        dense 25 24
+        tiled 25 24
+        """
+        data = self.data
+
+        count = 0
+        for y, x_start, x_stop in merge_spans(spans):
+            if hasattr(data, 'count_span'):
+                count += data.count_span(y, x_start, x_stop, value)
+                continue
+
+            # Only probe the cells known to be stored in the row when it is sparser than the span
+            if self.indexed and len(self._row_index.get(y, ())) < x_stop - x_start:
+                xs = filter(lambda x: x_start <= x < x_stop, self._row_index.get(y, ()))
+            else:
+                xs = range(x_start, x_stop)
+
+            cells = map(lambda x: data.get((x, y), _MISSING), xs)
+            if value is _MISSING:
+                count += sum(map(lambda v: v is not _MISSING, cells))
+            else:
+                count += sum(map(lambda v: v is not _MISSING and v == value, cells))
+
+        return count
+
+    def _update_bounds(self, x, y):
+        """Update the min/max values encountered if warranted."""
         if self.min_x is None:
-            # Sanity check, the other coordinates must also be `None`
-            assert all(map(lambda c: c is None, (self.min_y, self.max_x, self.max_y)))
-            return "Empty"
+            self.min_x = self.max_x = x
+            self.min_y = self.max_y = y
+            return
 
-        # Sanity check, all coordinates are non-`None`
-        assert all(map(lambda c: c is not None, (self.min_x, self.min_y, self.max_x, self.max_y)))
-        
-        # Iterate from (min_x, max_y) -> (max_x, min_y) inclusive
-        ret = ""
-        for y in range(self.max_y, self.min_y - 1, -1):        
-            for x in range(self.min_x, self.max_x + 1):
-                coord = Coordinate(x, y)
-                ret += str(self[coord])
-
-            # Add a newline only if it is not the last iteration
-            if y > self.min_y:
-                ret += "\n"
-                
-        return ret
+        if x < self.min_x:
+            self.min_x = x
+        elif x > self.max_x:
+            self.max_x = x
+
+        if y < self.min_y:
+            self.min_y = y
+        elif y > self.max_y:
+            self.max_y = y
+
+    def _update_indexes(self, key, value):
+        """Record the write of ``value`` at ``key`` in the secondary indexes."""
+        old_value = self.data.get(key, _MISSING)
+
+        if old_value is _MISSING:
+            # A new cell, record its location in the row and column indexes
+            x, y = key
+            self._row_index.setdefault(y, set()).add(x)
+            self._column_index.setdefault(x, set()).add(y)
+        else:
+            # Overwriting a cell, remove it from the `old_value` index
+            old_cells = self._value_index[old_value]
+            old_cells.discard(key)
+            if not old_cells:
+                del self._value_index[old_value]
+
+        self._value_index.setdefault(value, set()).add(key)
+
+    def _check_indexed(self):
+        if not self.indexed:
+            raise RuntimeError("Secondary index queries require an `indexed` coordinate system.")
+
+    def cells_in_row(self, y, value=_MISSING):
+        """Yield the ``Coordinate`` of every stored cell in row ``y``, optionally only those of ``value``."""
+        self._check_indexed()
+
+        for x in self._row_index.get(y, ()):
+            if value is _MISSING or self.data.get((x, y)) == value:
+                yield Coordinate(x, y)
+
+    def cells_in_column(self, x, value=_MISSING):
+        """Yield the ``Coordinate`` of every stored cell in column ``x``, optionally only those of ``value``."""
+        self._check_indexed()
+
+        for y in self._column_index.get(x, ()):
+            if value is _MISSING or self.data.get((x, y)) == value:
+                yield Coordinate(x, y)
+
+    def cells_with(self, value):
+        """Yield the ``Coordinate`` of every stored cell of ``value``."""
+        self._check_indexed()
+        yield from starmap(Coordinate, self._value_index.get(value, ()))
+
+    def count(self, value):
+        """Return the number of stored cells of ``value``."""
+        self._check_indexed()
+        return len(self._value_index.get(value, ()))
+
+    def lowest_in_column(self, x):
+        """Return the lowest occupied y in column ``x``, ``None`` if the column is empty."""
+        self._check_indexed()
+        return min(self._column_index.get(x, ()), default=None)
+
+    def __str__(self):
+        stream = io.StringIO()
+        render(self, stream)
+        return stream.getvalue()
 
     def __repr__(self):
         return str(self)
@@ -171,4 +494,83 @@ class LazyCoordinateSystem():
         yield from starmap(lambda k, v: (Coordinate(*k), v), self.data.items())
 
     def copy(self):
-        return copy.deepcopy(self)
+        """Return a cheap copy-on-write copy of this coordinate system.
+
+        The current cells are frozen as a base shared between ``self`` and the copy, each of which
+        continue writing into their own overlay. Any other attributes are copied shallowly.
+        """
+        from .storage import LayeredStorage
+
+        # Share the base directly rather than stacking another layer over an untouched overlay
+        if isinstance(self.data, LayeredStorage) and not self.data.overlay:
+            base = self.data.base
+        else:
+            base = self.data
+
+        inst = copy.copy(self)
+        self.data = LayeredStorage(base)
+        inst.data = LayeredStorage(base)
+
+        # The secondary indexes are not layered, so they must be copied outright
+        if self.indexed:
+            inst._row_index = copy.deepcopy(self._row_index)
+            inst._column_index = copy.deepcopy(self._column_index)
+            inst._value_index = copy.deepcopy(self._value_index)
+
+        return inst
+
+    def flatten(self):
+        """Merge any copy-on-write layers back into a single storage owned by ``self``."""
+        from .storage import LayeredStorage
+        if isinstance(self.data, LayeredStorage):
+            self.data = self.data.flatten()
+
+    def save(self, path, *, layout=None):
+        """Save the cells to a compact binary snapshot at ``path``, see ``advent_support.snapshot``."""
+        from . import snapshot
+        bounds = (self.min_x, self.max_x, self.min_y, self.max_y)
+        snapshot.save(path, self.data, self.fill, bounds, layout=layout)
+
+    def to_bytes(self, *, layout=None) -> bytes:
+        """Return the cells as the ``bytes`` of a binary snapshot, see ``save``."""
+        from . import snapshot
+        bounds = (self.min_x, self.max_x, self.min_y, self.max_y)
+        return snapshot.dumps(self.data, self.fill, bounds, layout=layout)
+
+    @classmethod
+    def load(cls, path, *, lazy=True):
+        """Load a coordinate system from the binary snapshot at ``path``.
+
+        When ``lazy``, the snapshot is memory-mapped and cells are read from it on demand, with
+        any writes landing in a copy-on-write layer. Only the cells, ``fill`` and bounds are
+        restored, subclasses must restore any of their other attributes themselves.
+        """
+        from . import snapshot
+        inst = cls.__new__(cls)
+        inst._restore(*snapshot.load(path, lazy=lazy), lazy=lazy)
+        return inst
+
+    def restore_bytes(self, buffer, *, lazy=True):
+        """Replace the cells of ``self`` in place by those of the snapshot ``bytes`` of ``to_bytes``.
+
+        Unlike ``load``, every other attribute of ``self`` is left untouched. An ``indexed``
+        coordinate system stays so, its secondary indexes rebuilt from the restored cells.
+        """
+        from . import snapshot
+        self._restore(*snapshot.loads(buffer, lazy=lazy), lazy=lazy, indexed=self.indexed)
+
+    def _restore(self, storage, fill, bounds, *, lazy, indexed=False):
+        from .storage import LayeredStorage
+        LazyCoordinateSystem.__init__(self, fill=fill, indexed=indexed)
+        self.data = LayeredStorage(storage) if lazy else storage
+        self.min_x, self.max_x, self.min_y, self.max_y = bounds
+
+        if indexed:
+            self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """Record every stored cell in the, initially empty, secondary indexes."""
+        for (x, y), value in self.data.items():
+            self._row_index.setdefault(y, set()).add(x)
+            self._column_index.setdefault(x, set()).add(y)
+            self._value_index.setdefault(value, set()).add((x, y))
@@ -0,0 +1,121 @@
+"""A long-lived solver daemon, answering solve requests over a local Unix domain socket.
+
+The daemon imports every solution once, when it starts, so that a request pays neither the start
+up of the interpreter nor the imports of the solutions. Requests and responses are JSON lines,
+any number of them per connection, and every connection is served by its own thread. A request
+names the ``day``, optionally a single ``part``, and either the path of an ``input`` file or its
+``input_text``, defaulting to the day's own input::
+
+    {"day": 14, "part": 1, "input": "/abs/path/input.txt"}
+
+A response is a record like those of ``advent_support.batch``, holding the ``seconds`` and
+``answers`` of the phases or the ``error`` the request failed with.
+"""
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+from typing import Iterable, Iterator
+
+from . import runner
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "advent_support.sock")
+
+class SolveHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.solve(json.loads(line))
+            except Exception as e:
+                response = {'error': f"{type(e).__name__}: {e}"}
+
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+
+class SolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serves solve requests with the solutions of every day under ``root``, imported up front."""
+    daemon_threads = True
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, *, root='.'):
+        self.solutions = {day: runner.load_solution(day, root=root) for day in runner.available_days(root)}
+        super().__init__(socket_path, SolveHandler)
+
+    def solve(self, request) -> dict:
+        day = request['day']
+        if day not in self.solutions:
+            raise KeyError(f"There is no solution of day {day}")
+
+        module = self.solutions[day]
+        parts = runner.PARTS if request.get('part') is None else (request['part'],)
+        record = {'day': day}
+
+        if 'input_text' in request:
+            # The solutions parse files, so spill the text to one
+            with tempfile.NamedTemporaryFile('w', suffix='.txt') as f:
+                f.write(request['input_text'])
+                f.flush()
+                results = runner.run_solution(module, day, f.name, parts=parts)
+        else:
+            record['input'] = request.get('input') or runner.default_input(module)
+            results = runner.run_solution(module, day, record['input'], parts=parts)
+
+        record.update(runner.results_record(results))
+        return record
+
+def remove_stale_socket(socket_path):
+    """Remove the socket left behind by a dead daemon, refusing to replace a live one."""
+    if not os.path.exists(socket_path):
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+        else:
+            raise FileExistsError(f"A daemon is already serving at: {socket_path}")
+
+def _terminate(signum, frame):
+    raise SystemExit(0)
+
+def serve(socket_path=DEFAULT_SOCKET, *, root='.'):
+    """Serve solve requests at ``socket_path`` until interrupted or terminated."""
+    remove_stale_socket(socket_path)
+
+    # Stop as on an interrupt, so that the socket is removed on a plain `kill` too
+    signal.signal(signal.SIGTERM, _terminate)
+    with SolverServer(socket_path, root=root) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+
+def request(requests: Iterable[dict], *, socket_path=DEFAULT_SOCKET) -> Iterator[dict]:
+    """Send the ``requests`` to the daemon at ``socket_path`` over a single connection, yielding the responses."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile('rwb') as f:
+            for req in requests:
+                f.write(json.dumps(req).encode() + b'\n')
+                f.flush()
+                yield json.loads(f.readline())
+
+def solve(day, input_path=None, *, input_text=None, part=None, socket_path=DEFAULT_SOCKET) -> dict:
+    """Solve a single input of ``day`` with the daemon at ``socket_path``, see ``request``."""
+    req = {'day': day, 'part': part}
+    if input_text is not None:
+        req['input_text'] = input_text
+    elif input_path is not None:
+        # The daemon may run in another directory
+        req['input'] = os.path.abspath(input_path)
+
+    return next(request([req], socket_path=socket_path))
+
+def record_results(record) -> list[runner.PhaseResult]:
+    """Convert a response ``record`` back to the ``PhaseResult`` of each of its phases."""
+    return [runner.PhaseResult(record['day'], phase, seconds, record['answers'].get(phase))
+            for phase, seconds in record['seconds'].items()]
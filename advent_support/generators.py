@@ -0,0 +1,352 @@
+"""Seeded, scalable synthetic puzzle inputs for load testing the daily solutions.
+
+Every generator writes an input in exactly the format its ``dayN/solution.py`` parses to a text
+stream. A ``scale`` of 1 produces roughly the size of a real puzzle input, and the size grows
+linearly in ``scale``: the number of lines, grid cells, directories, items or sensors. The same
+``seed`` and ``scale`` always produce the same input.
+"""
+import io
+import math
+import random
+import re
+import string
+
+# NumPy is imported by the grid generators alone, so that the command line interface, which
+# lists the generators, starts up without it
+
+# Inputs are written in batches of lines to bound the memory of huge inputs
+BATCH = 10_000
+
+def _write_lines(f, lines):
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) == BATCH:
+            f.write('\n'.join(batch) + '\n')
+            batch = []
+
+    if batch:
+        f.write('\n'.join(batch) + '\n')
+
+def _count(base, scale, minimum=1):
+    return max(minimum, round(base * scale))
+
+def _numpy_rng(rng):
+    import numpy
+    return numpy.random.default_rng(rng.getrandbits(64))
+
+def day1(rng, scale, f):
+    """Groups of calorie counts, one group per elf, separated by blank lines."""
+    def lines():
+        for i in range(_count(250, scale, minimum=3)):
+            if i:
+                yield ''
+            yield from (str(rng.randint(1000, 70_000)) for _ in range(rng.randint(1, 15)))
+
+    _write_lines(f, lines())
+
+def day2(rng, scale, f):
+    """Rock paper scissors rounds."""
+    _write_lines(f, (f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(_count(2500, scale))))
+
+def day3(rng, scale, f):
+    """Rucksacks, in groups of 3 sharing exactly one badge, whose halves share exactly one item."""
+    letters = string.ascii_letters
+
+    def rucksack(items, badge):
+        # The halves only share `shared`, and the `badge` is only in the first half
+        shared, *rest = items
+        first_items, second_items = rest[:len(rest) // 2], rest[len(rest) // 2:]
+        half = rng.randint(4, 24)
+        first = [shared, badge] + rng.choices(first_items, k=half - 2)
+        second = [shared] + rng.choices(second_items, k=half - 1)
+        rng.shuffle(first)
+        rng.shuffle(second)
+        return ''.join(first + second)
+
+    def lines():
+        for _ in range(_count(100, scale)):
+            badge = rng.choice(letters)
+
+            # Every rucksack of the group draws from its own disjoint set of items
+            pool = [c for c in letters if c != badge]
+            rng.shuffle(pool)
+            for i in range(3):
+                yield rucksack(pool[17 * i:17 * (i + 1)], badge)
+
+    _write_lines(f, lines())
+
+def day4(rng, scale, f):
+    """Pairs of section assignment ranges."""
+    def assignment():
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    _write_lines(f, (f"{assignment()},{assignment()}" for _ in range(_count(1000, scale))))
+
+def day5(rng, scale, f):
+    """A drawing of 9 crate stacks followed by valid moves, never emptying any stack."""
+    n_stacks = 9
+    heights = [rng.randint(1, _count(8, scale)) for _ in range(n_stacks)]
+
+    # Draw the stacks from the top row down
+    lines = []
+    for row in reversed(range(max(heights))):
+        cells = (f"[{rng.choice(string.ascii_uppercase)}]" if row < h else "   " for h in heights)
+        lines.append(' '.join(cells))
+    lines.append(' '.join(f" {i + 1} " for i in range(n_stacks)))
+    lines.append('')
+
+    # Track the stack heights so that every move leaves at least one crate behind
+    for _ in range(_count(500, scale)):
+        move_from = rng.choice([i for i, h in enumerate(heights) if h >= 2] or [None])
+        if move_from is None:
+            break
+
+        move_to = rng.choice([i for i in range(n_stacks) if i != move_from])
+        move_n = rng.randint(1, heights[move_from] - 1)
+        heights[move_from] -= move_n
+        heights[move_to] += move_n
+        lines.append(f"move {move_n} from {move_from + 1} to {move_to + 1}")
+
+    _write_lines(f, lines)
+
+def day6(rng, scale, f):
+    """A datastream whose start-of-packet and start-of-message markers are only at its very end."""
+    # No window of the body holds 4 distinct characters, so the markers only appear in the tail
+    body = ''.join(rng.choices('abc', k=_count(4096, scale)))
+    tail = ''.join(rng.sample(string.ascii_lowercase[3:], k=14))
+    f.write(body + tail + '\n')
+
+def day7(rng, scale, f):
+    """A terminal log of ``cd`` and ``ls`` commands exploring a deep directory tree."""
+    # The solution recurses through the tree, so bound its depth
+    max_depth = 200
+    n_dirs = _count(200, scale)
+
+    # Build the tree, favouring recently created directories as parents to grow deep chains
+    children = [[]]
+    depths = [0]
+    for i in range(1, n_dirs):
+        parent = rng.randint(max(0, i - 8), i - 1) if rng.random() < 0.7 else rng.randint(0, i - 1)
+        while depths[parent] >= max_depth:
+            parent = rng.randint(0, i - 1)
+        children[parent].append(i)
+        children.append([])
+        depths.append(depths[parent] + 1)
+
+    # The disk of 70_000_000 must lack free space to fit 30_000_000, so the total exceeds 40_000_000
+    n_files = [rng.randint(0, 5) for _ in range(n_dirs)]
+    n_files[0] += 1
+    total = rng.randint(41_000_000, 69_000_000)
+    weights = [rng.random() for _ in range(sum(n_files))]
+    scale_factor = total / sum(weights)
+    sizes = iter([1 + int(w * scale_factor) for w in weights])
+
+    def lines():
+        yield "$ cd /"
+
+        # Walk the tree depth-first, with explicit `None` markers to step back out of a directory
+        stack = [0]
+        while stack:
+            d = stack.pop()
+            if d is None:
+                yield "$ cd .."
+                continue
+            if d:
+                yield f"$ cd d{d}"
+
+            yield "$ ls"
+            yield from (f"dir d{child}" for child in children[d])
+            yield from (f"{next(sizes)} f{d}_{i}.txt" for i in range(n_files[d]))
+
+            if d:
+                stack.append(None)
+            stack.extend(reversed(children[d]))
+
+    _write_lines(f, lines())
+
+def day8(rng, scale, f):
+    """A square forest of tree heights."""
+    import numpy
+    side = _count(99 * math.sqrt(scale), 1, minimum=3)
+    heights = _numpy_rng(rng).integers(0, 10, size=(side, side), dtype=numpy.uint8) + ord('0')
+    _write_grid(f, heights)
+
+def _write_grid(f, chars):
+    import numpy
+    rows = numpy.full((chars.shape[0], chars.shape[1] + 1), ord('\n'), dtype=numpy.uint8)
+    rows[:, :-1] = chars
+    f.write(rows.tobytes().decode('ascii'))
+
+def day9(rng, scale, f):
+    """Rope head movements."""
+    _write_lines(f, (f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(_count(2000, scale))))
+
+def day10(rng, scale, f):
+    """A program of ``noop`` and ``addx`` instructions."""
+    def lines():
+        for _ in range(_count(140, scale)):
+            if rng.random() < 0.35:
+                yield "noop"
+            else:
+                yield f"addx {rng.randint(-20, 20)}"
+
+    _write_lines(f, lines())
+
+def day11(rng, scale, f):
+    """8 monkeys with co-prime tests, whose item lists grow with ``scale``."""
+    primes = [2, 3, 5, 7, 11, 13, 17, 19]
+    rng.shuffle(primes)
+    squarer = rng.randrange(len(primes))
+
+    descs = []
+    for i, test_mod in enumerate(primes):
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(_count(4, scale)))
+        if i == squarer:
+            operation = "old * old"
+        else:
+            operation = f"old {rng.choice('+*')} {rng.randint(1, 9)}"
+        true_recipient, false_recipient = rng.sample([j for j in range(len(primes)) if j != i], k=2)
+
+        descs.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {test_mod}\n"
+            f"    If true: throw to monkey {true_recipient}\n"
+            f"    If false: throw to monkey {false_recipient}\n"
+        )
+
+    f.write('\n'.join(descs))
+
+def day12(rng, scale, f):
+    """A heightmap climbing to 'E' from every cell, with 'S' on the lowest level.
+
+    The height descends with a noisy Manhattan distance from 'E'. The distance changes by at
+    most one level per step towards 'E', so every cell, and in particular 'S', reaches it.
+    """
+    import numpy
+    np_rng = _numpy_rng(rng)
+    nrows = _count(41 * math.sqrt(scale), 1, minimum=27)
+    ncols = _count(173 * math.sqrt(scale), 1, minimum=27)
+    er, ec = rng.randrange(nrows), rng.randrange(ncols)
+
+    rows, cols = numpy.ogrid[:nrows, :ncols]
+    dist = numpy.abs(rows - er) + numpy.abs(cols - ec)
+    level_width = max(1, int(dist.max()) // 26)
+
+    # Random walks along the rows and columns, stepping by less than a level, perturb the distance
+    def walk(n):
+        steps = np_rng.integers(-(level_width - 1), level_width, size=n)
+        return numpy.cumsum(steps)
+    noise = walk(nrows)[:, None] + walk(ncols)[None, :]
+    noisy_dist = numpy.maximum(dist + noise - noise[er, ec], 0)
+
+    levels = numpy.minimum(noisy_dist // level_width, 25)
+    if not numpy.any(levels == 25):
+        levels = numpy.minimum(dist // level_width, 25)
+
+    chars = (ord('z') - levels).astype(numpy.uint8)
+    lowest = numpy.argwhere(levels == 25)
+    sr, sc = lowest[rng.randrange(len(lowest))]
+    chars[sr, sc] = ord('S')
+    chars[er, ec] = ord('E')
+    _write_grid(f, chars)
+
+def day13(rng, scale, f):
+    """Pairs of randomly nested packets."""
+    def packet(depth=0):
+        contents = []
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                contents.append(packet(depth + 1))
+            else:
+                contents.append(str(rng.randint(0, 10)))
+        return '[' + ','.join(contents) + ']'
+
+    def distinct_packet():
+        # A packet of nested singletons of 2 or 6 would compare equal to a divider packet
+        while re.fullmatch(r'\[+[26]\]+', p := packet()):
+            pass
+        return p
+
+    def lines():
+        for i in range(_count(150, scale)):
+            if i:
+                yield ''
+            yield distinct_packet()
+            yield distinct_packet()
+
+    _write_lines(f, lines())
+
+def day14(rng, scale, f):
+    """Paths of horizontal and vertical rock lines beneath the sand source at 500,0.
+
+    Every rock lays strictly within the diagonals falling from the source, so the sand always
+    escapes along them into the abyss in part 1, rather than piling back up to the source.
+    """
+    spread = math.sqrt(scale)
+    half_width, depth = int(50 * spread), int(160 * spread)
+
+    def clamp_x(x, y):
+        return min(max(x, 500 - (y - 1)), 500 + (y - 1))
+
+    def path():
+        # Every path is at least one segment, so draw anew should every step of a path be clamped away
+        points = []
+        while len(points) < 2:
+            y = rng.randint(10, 10 + depth)
+            x = clamp_x(rng.randint(500 - half_width, 500 + half_width), y)
+            points = [(x, y)]
+            for i in range(rng.randint(1, 5)):
+                # Alternate between horizontal and vertical segments
+                if i % 2 == 0:
+                    point = (clamp_x(x + rng.choice((-1, 1)) * rng.randint(1, 8), y), y)
+                else:
+                    point = (x, max(abs(x - 500) + 1, y + rng.choice((-1, 1)) * rng.randint(1, 8)))
+
+                # Drop the steps clamped to nothing, rather than emitting zero length segments
+                if point != (x, y):
+                    x, y = point
+                    points.append(point)
+
+        return ' -> '.join(f"{x},{y}" for x, y in points)
+
+    _write_lines(f, (path() for _ in range(_count(150, scale))))
+
+def day15(rng, scale, f):
+    """Sensors across the 4_000_000 wide search area, each with its closest beacon."""
+    def line():
+        sx, sy = rng.randint(0, 4_000_000), rng.randint(0, 4_000_000)
+        dx = rng.randint(-1_000_000, 1_000_000)
+        dy = rng.choice((-1, 1)) * rng.randint(1, 1_000_000)
+        return f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + dx}, y={sy + dy}"
+
+    _write_lines(f, (line() for _ in range(_count(30, scale))))
+
+GENERATORS = {
+    1: day1, 2: day2, 3: day3, 4: day4, 5: day5, 6: day6, 7: day7, 8: day8,
+    9: day9, 10: day10, 11: day11, 12: day12, 13: day13, 14: day14, 15: day15,
+}
+
+def generate(day, f, *, seed=0, scale=1):
+    """Write a synthetic input of ``day`` to the text stream ``f``."""
+    if day not in GENERATORS:
+        raise ValueError(f"There is no input generator of day {day}")
+    if scale <= 0:
+        raise ValueError(f"The scale must be positive, not {scale}")
+
+    # Seed per day, so that the input of a day does not depend on which others are generated
+    GENERATORS[day](random.Random(f"{seed}:{day}"), scale, f)
+
+def generate_text(day, *, seed=0, scale=1) -> str:
+    """Return a synthetic input of ``day``, see ``generate``."""
+    f = io.StringIO()
+    generate(day, f, seed=seed, scale=scale)
+    return f.getvalue()
+
+def generate_file(day, path, *, seed=0, scale=1):
+    """Write a synthetic input of ``day`` to ``path``, see ``generate``."""
+    with open(path, 'w') as f:
+        generate(day, f, seed=seed, scale=scale)
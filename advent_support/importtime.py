@@ -0,0 +1,74 @@
+"""Measure the start-up import cost of the daily solutions with ``python -X importtime``.
+
+Every solution is imported in a fresh interpreter, from within its own directory as when it is
+run directly, and is summarized by its cumulative import time along with the modules it imports
+directly, costliest first. The cost of starting the interpreter itself is excluded.
+"""
+import os
+import subprocess
+import sys
+from typing import NamedTuple
+
+from .runner import solution_path
+
+# The directory holding the `advent_support` package, which the solutions import
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A solution exceeds the start-up budget when its imports take longer than this, in seconds
+DEFAULT_BUDGET = 0.25
+
+class ImportCost(NamedTuple):
+    name: str
+    seconds: float
+
+class ImportProfile(NamedTuple):
+    day: int
+    seconds: float
+    imports: list[ImportCost]
+    """The modules imported directly by the solution, costliest first."""
+
+def parse_importtime(stderr, module) -> ImportProfile:
+    """Summarize the ``-X importtime`` report ``stderr`` of an import of ``module``, see ``ImportProfile``.
+
+    The report lists every module after all of the modules it imports, each indented by two
+    spaces per level of nesting, as ``import time: self [us] | cumulative | imported package``.
+    """
+    children = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        cost = ImportCost(name.strip(), int(cumulative) / 1e6)
+
+        if depth == 1:
+            children.append(cost)
+        elif depth == 0:
+            if cost.name == module:
+                return ImportProfile(None, cost.seconds, sorted(children, key=lambda c: -c.seconds))
+
+            # The children of an unrelated top-level import, such as those of the interpreter start-up
+            children = []
+
+    raise ValueError(f"The import of {module} is missing from the report")
+
+def measure_imports(day, *, root='.') -> ImportProfile:
+    """Import the solution of ``day`` in a fresh interpreter, returning its ``ImportProfile``."""
+    path = solution_path(day, root=root)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"There is no solution of day {day} at: {path}")
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PACKAGE_ROOT, env.get('PYTHONPATH')]))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import solution'],
+                          cwd=os.path.dirname(path), env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing the solution of day {day} failed:\n{proc.stderr}")
+
+    return parse_importtime(proc.stderr, 'solution')._replace(day=day)
+
+def format_profile(profile: ImportProfile, *, top=5) -> str:
+    lines = [f"day{profile.day:<3} imports {profile.seconds * 1000:>10.3f} ms"]
+    lines.extend(f"    {cost.name:<30} {cost.seconds * 1000:>10.3f} ms" for cost in profile.imports[:top])
+    return '\n'.join(lines)
@@ -0,0 +1,138 @@
+from typing import Iterable, Iterator, Optional
+
+import numpy
+
+class IntervalSet():
+    """A set of integers stored as sorted, disjoint, half-open ``[start, stop)`` intervals.
+
+    The intervals are kept in two sorted NumPy arrays and are always fully merged, so no two
+    intervals overlap nor touch. Intervals are given as ``(start, stop)`` pairs or ``range``s.
+    """
+
+    def __init__(self, intervals: Iterable = ()):
+        intervals = [(r.start, r.stop) if isinstance(r, range) else tuple(r) for r in intervals]
+        starts = numpy.fromiter((start for start, _ in intervals), dtype=numpy.int64, count=len(intervals))
+        stops = numpy.fromiter((stop for _, stop in intervals), dtype=numpy.int64, count=len(intervals))
+        self.starts, self.stops = self._merge(starts, stops)
+
+    @classmethod
+    def from_arrays(cls, starts, stops) -> "IntervalSet":
+        """Bulk create an ``IntervalSet`` from parallel arrays of interval ``starts`` and ``stops``."""
+        inst = cls.__new__(cls)
+        inst.starts, inst.stops = cls._merge(numpy.asarray(starts, dtype=numpy.int64),
+                                             numpy.asarray(stops, dtype=numpy.int64))
+        return inst
+
+    @staticmethod
+    def _merge(starts, stops):
+        """Sort and merge any overlapping or touching intervals in O(n log n)."""
+        # Drop any empty intervals
+        non_empty = starts < stops
+        starts, stops = starts[non_empty], stops[non_empty]
+        if len(starts) == 0:
+            return starts, stops
+
+        order = numpy.argsort(starts, kind='stable')
+        starts, stops = starts[order], stops[order]
+
+        # An interval begins a new merged group only if it starts beyond every previous stop
+        reach = numpy.maximum.accumulate(stops)
+        is_first = numpy.empty(len(starts), dtype=bool)
+        is_first[0] = True
+        is_first[1:] = starts[1:] > reach[:-1]
+
+        # Each group stops at the furthest reach right before the next group begins
+        firsts = numpy.flatnonzero(is_first)
+        lasts = numpy.append(firsts[1:] - 1, len(starts) - 1)
+        return starts[firsts], reach[lasts]
+
+    def __iter__(self) -> Iterator[range]:
+        return map(range, self.starts.tolist(), self.stops.tolist())
+
+    def __len__(self):
+        """The number of disjoint intervals, see ``length`` for the number of integers covered."""
+        return len(self.starts)
+
+    def __bool__(self):
+        return len(self.starts) > 0
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return numpy.array_equal(self.starts, other.starts) and numpy.array_equal(self.stops, other.stops)
+
+    def __repr__(self):
+        return "IntervalSet([" + ", ".join(f"[{r.start}, {r.stop})" for r in self) + "])"
+
+    @property
+    def length(self) -> int:
+        """The total number of integers covered."""
+        return int(numpy.sum(self.stops - self.starts))
+
+    @property
+    def bounds(self) -> Optional[range]:
+        """The ``range`` spanning from the first to the last covered integer, ``None`` if empty."""
+        if not self:
+            return None
+        return range(int(self.starts[0]), int(self.stops[-1]))
+
+    def __contains__(self, value) -> bool:
+        """Test whether an integer, or every integer of a ``range``, is covered."""
+        if isinstance(value, range):
+            if len(value) == 0:
+                return True
+            first, last = min(value[0], value[-1]), max(value[0], value[-1])
+        else:
+            first = last = value
+
+        # The only interval which may contain `first` is the last one starting at or before it
+        i = int(numpy.searchsorted(self.starts, first, side='right')) - 1
+        return i >= 0 and last < self.stops[i]
+
+    def add(self, start, stop):
+        """Insert the interval ``[start, stop)``, merging it with any overlapping intervals."""
+        self.update([(start, stop)])
+
+    def update(self, intervals: Iterable):
+        """Bulk insert the ``intervals``, merging them all in a single pass."""
+        other = IntervalSet(intervals)
+        self.starts, self.stops = self._merge(numpy.concatenate((self.starts, other.starts)),
+                                              numpy.concatenate((self.stops, other.stops)))
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet.from_arrays(numpy.concatenate((self.starts, other.starts)),
+                                       numpy.concatenate((self.stops, other.stops)))
+
+    def complement(self, start, stop) -> "IntervalSet":
+        """Return the integers in ``[start, stop)`` which are not covered."""
+        # The gaps lay in between consecutive intervals, plus the two unbounded ends
+        gap_starts = numpy.concatenate(([start], self.stops))
+        gap_stops = numpy.concatenate((self.starts, [stop]))
+        return IntervalSet.from_arrays(numpy.clip(gap_starts, start, stop),
+                                       numpy.clip(gap_stops, start, stop))
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        if not self or not other:
+            return IntervalSet()
+
+        # By De Morgan's law, within the bounds spanning both sets
+        start = min(int(self.starts[0]), int(other.starts[0]))
+        stop = max(int(self.stops[-1]), int(other.stops[-1]))
+        return (self.complement(start, stop) | other.complement(start, stop)).complement(start, stop)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        if not self:
+            return IntervalSet()
+        return self & other.complement(int(self.starts[0]), int(self.stops[-1]))
+
+    def overlaps(self, other: "IntervalSet") -> bool:
+        return bool(self & other)
+
+    def gaps(self, start=None, stop=None) -> Iterator[range]:
+        """Yield the uncovered ``range``s within ``[start, stop)``, defaulting to the set's bounds."""
+        if not self and (start is None or stop is None):
+            return iter(())
+
+        start = int(self.starts[0]) if start is None else start
+        stop = int(self.stops[-1]) if stop is None else stop
+        return iter(self.complement(start, stop))
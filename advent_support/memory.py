@@ -0,0 +1,130 @@
+"""Account for the memory of the phases of the daily solutions with ``tracemalloc``.
+
+Every phase reports the ``peak`` of the memory it allocated over its run, the ``net`` memory it
+left allocated at its end, such as the parsed puzzle of the parse phase, the source lines which
+allocated the most of that, and the number of live instances of the key classes at its end.
+
+A budget file maps each day to the most ``peak`` bytes of its phases::
+
+    {"day15": {"parse": 10000000, "part1": 200000000}, ...}
+"""
+import gc
+import json
+import os
+import tracemalloc
+from collections import Counter
+from typing import NamedTuple, Optional
+
+from .runner import PARTS, has_part
+
+DEFAULT_BUDGETS = os.path.join("benchmarks", "memory.json")
+
+# The classes whose live instances are counted, by name, as they are defined by the solutions
+KEY_CLASSES = ('Coordinate', 'Vector', 'Packet', 'TreeProperty', 'Directory')
+
+class LineAllocation(NamedTuple):
+    location: str
+    size: int
+    count: int
+
+class PhaseMemory(NamedTuple):
+    day: int
+    phase: str
+    peak: int
+    net: int
+    top: list[LineAllocation]
+    live: dict[str, int]
+
+class OverBudget(NamedTuple):
+    day: int
+    phase: str
+    budget: int
+    peak: int
+
+def live_instances(class_names=KEY_CLASSES) -> dict[str, int]:
+    """Count the live objects tracked by the garbage collector whose class is named in ``class_names``."""
+    counts = Counter(type(obj).__name__ for obj in gc.get_objects())
+    return {name: counts[name] for name in class_names}
+
+def _snapshot():
+    # Exclude the allocations of the accounting itself, such as those of the snapshots
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+
+def measure(fn, *args, top=5, class_names=KEY_CLASSES):
+    """Call ``fn`` with ``args`` under ``tracemalloc``, returning its result and its ``PhaseMemory`` fields.
+
+    ``tracemalloc`` must be tracing already.
+    """
+    gc.collect()
+    before = _snapshot()
+    start, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    result = fn(*args)
+
+    _, peak = tracemalloc.get_traced_memory()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    after = _snapshot()
+
+    stats = [stat for stat in after.compare_to(before, 'lineno') if stat.size_diff]
+    lines = [LineAllocation(str(stat.traceback[0]), stat.size_diff, stat.count_diff) for stat in stats[:top]]
+
+    return result, {'peak': peak - start, 'net': current - start, 'top': lines,
+                    'live': live_instances(class_names)}
+
+def memory_solution(module, day, input_path, *, parts=PARTS, top=5, class_names=KEY_CLASSES) -> list[PhaseMemory]:
+    """Run the parse and ``parts`` phases of the solution ``module`` once each, measuring the memory of every phase."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    try:
+        puzzle, fields = measure(module.parse, input_path, top=top, class_names=class_names)
+        results = [PhaseMemory(day, 'parse', **fields)]
+
+        for part in parts:
+            if has_part(module, part):
+                phase = f"part{part}"
+                _, fields = measure(getattr(module, phase), puzzle, top=top, class_names=class_names)
+                results.append(PhaseMemory(day, phase, **fields))
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return results
+
+def load_budgets(path) -> dict:
+    """Load the budgets at ``path``, no budgets at all if there is no such file."""
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def find_over_budget(results, budgets) -> list[OverBudget]:
+    """Compare the ``peak`` of every phase of ``results`` to its budget, if it has one."""
+    over = []
+    for result in results:
+        budget: Optional[int] = budgets.get(f"day{result.day}", {}).get(result.phase)
+        if budget is not None and result.peak > budget:
+            over.append(OverBudget(result.day, result.phase, budget, result.peak))
+
+    return over
+
+def _mib(n_bytes):
+    return f"{n_bytes / 2**20:>10.3f} MiB"
+
+def format_text(result: PhaseMemory) -> str:
+    lines = [f"day{result.day:<3} {result.phase:<6} peak {_mib(result.peak)}  net {_mib(result.net)}"]
+    lines.extend(f"    {_mib(line.size)} {line.count:>+10} blocks  {line.location}" for line in result.top)
+    lines.append("    live " + ' '.join(f"{name}={count}" for name, count in result.live.items()))
+    return '\n'.join(lines)
+
+def format_json(result: PhaseMemory) -> str:
+    record = result._asdict()
+    record['top'] = [line._asdict() for line in result.top]
+    return json.dumps(record)
@@ -0,0 +1,75 @@
+"""An on-disk cache of parsed puzzle inputs, skipping the text parsing of repeated runs.
+
+A solution opts in by exposing a ``PARSER_VERSION`` alongside ``encode_parsed(puzzle) -> bytes``
+and ``decode_parsed(data)``, the inverse of one another. An artifact is keyed by the day, the
+``PARSER_VERSION`` and the hash of the input bytes, so bump the version on any change to what
+``parse`` returns or to its encoding. Unlike results, artifacts survive edits to the parts.
+"""
+import hashlib
+import os
+from typing import Optional
+
+from .result_cache import DEFAULT_DIR as RESULT_CACHE_DIR, DEFAULT_MAX_BYTES, evict_lru
+
+DEFAULT_DIR = os.path.join(RESULT_CACHE_DIR, 'parsed')
+
+def supports_parse_cache(module):
+    return all(hasattr(module, name) for name in ('PARSER_VERSION', 'encode_parsed', 'decode_parsed'))
+
+def parse_key(day, version, input_path) -> str:
+    with open(input_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return f"day{day}-v{version}-{digest}"
+
+class ParseCache():
+    """Stores encoded parsed inputs as binary files in ``directory``, using at most ``max_bytes`` of disk."""
+
+    def __init__(self, directory=DEFAULT_DIR, *, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def get(self, key) -> Optional[bytes]:
+        """Return the artifact stored under ``key``, ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        # Mark the artifact as recently used for the eviction
+        os.utime(path)
+        return data
+
+    def put(self, key, data: bytes):
+        """Store the artifact ``data`` under ``key``, then evict artifacts beyond the size budget."""
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Write aside and rename, so that readers never see a partial artifact
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        evict_lru(self.directory, self.max_bytes, suffix='.bin')
+
+    def parse(self, module, day, input_path):
+        """Parse ``input_path`` with the solution ``module``, decoding a cached artifact when there is one.
+
+        Solutions without an encoding are always parsed from the text.
+        """
+        if not supports_parse_cache(module):
+            return module.parse(input_path)
+
+        key = parse_key(day, module.PARSER_VERSION, input_path)
+        data = self.get(key)
+        if data is not None:
+            return module.decode_parsed(data)
+
+        puzzle = module.parse(input_path)
+        self.put(key, module.encode_parsed(puzzle))
+        return puzzle
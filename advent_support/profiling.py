@@ -0,0 +1,96 @@
+"""Profile the phases of the daily solutions with ``cProfile``.
+
+Every phase is profiled on its own and saved to ``dayN-<phase>.pstats``, for ``pstats`` or
+``snakeviz``, along with the collapsed stacks of ``dayN-<phase>.folded``, one ``a;b;c <us>``
+line per stack, for ``flamegraph.pl`` or ``speedscope``.
+
+``cProfile`` records only the time of each caller and callee pair, rather than whole stacks, so
+the stacks are reconstructed by splitting the time of every function between its callers in
+proportion to the time spent on its behalf. Recursive calls are folded into their outermost call.
+"""
+import cProfile
+import os
+import pstats
+from collections import defaultdict
+
+from .runner import PARTS, PhaseResult, has_part, timed
+
+# Stacks attributed less time than this, in seconds, are dropped from the collapsed stacks
+MIN_STACK_SECONDS = 1e-6
+
+def frame_name(func) -> str:
+    """The name of the ``pstats`` function key ``func``, without the spaces which separate the counts."""
+    filename, line, name = func
+    if filename == '~':
+        # A built-in, such as "<built-in method builtins.len>"
+        return name.replace(' ', '_')
+    return f"{name}({os.path.basename(filename)}:{line})"
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    """Reconstruct the stacks of the profile ``stats``, mapping each to the seconds spent in its last frame."""
+    callees = defaultdict(dict)
+    roots = []
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, (_, _, _, edge_seconds) in callers.items():
+            callees[caller][func] = edge_seconds
+
+    stacks = defaultdict(float)
+
+    def walk(func, path, names, share):
+        """Attribute the ``share`` of the time of ``func`` spent within the stack ``names``."""
+        _, _, self_seconds, total_seconds, _ = stats.stats[func]
+        names = names + [frame_name(func)]
+        stacks[';'.join(names)] += self_seconds * share
+
+        for callee, edge_seconds in callees[func].items():
+            callee_seconds = stats.stats[callee][3]
+            if callee in path or callee_seconds <= 0 or edge_seconds * share < MIN_STACK_SECONDS:
+                continue
+            walk(callee, path | {callee}, names, share * edge_seconds / callee_seconds)
+
+    for root in roots:
+        walk(root, {root}, [], 1.0)
+
+    return {stack: seconds for stack, seconds in stacks.items() if seconds >= MIN_STACK_SECONDS}
+
+def save_collapsed(path, stats: pstats.Stats):
+    with open(path, 'w') as f:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            f.write(f"{stack} {round(seconds * 1e6)}\n")
+
+def profiled(fn, *args, path):
+    """Call ``fn`` with ``args`` under ``cProfile``, saving the profile to ``path`` and its collapsed stacks beside it.
+
+    Returns the result of ``fn`` and the wall time it took, inflated by the profiling, in seconds.
+    """
+    profiler = cProfile.Profile()
+    result, seconds = timed(profiler.runcall, fn, *args)
+
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(path)
+    save_collapsed(os.path.splitext(path)[0] + '.folded', stats)
+
+    return result, seconds
+
+def profile_solution(module, day, input_path, *, parts=PARTS, output_dir='profiles') -> list[PhaseResult]:
+    """Run the parse and ``parts`` phases of the solution ``module`` once each, profiling every phase.
+
+    The profiles are saved to ``output_dir``, see the module documentation.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    def path(phase):
+        return os.path.join(output_dir, f"day{day}-{phase}.pstats")
+
+    puzzle, seconds = profiled(module.parse, input_path, path=path('parse'))
+    results = [PhaseResult(day, 'parse', seconds)]
+
+    for part in parts:
+        if has_part(module, part):
+            phase = f"part{part}"
+            answer, seconds = profiled(getattr(module, phase), puzzle, path=path(phase))
+            results.append(PhaseResult(day, phase, seconds, answer))
+
+    return results
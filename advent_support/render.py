@@ -0,0 +1,109 @@
+import sys
+from typing import NamedTuple, TextIO, Optional
+
+# ANSI foreground color codes of the supported named colors
+ANSI_COLORS = {
+    'black': 30,
+    'red': 31,
+    'green': 32,
+    'yellow': 33,
+    'blue': 34,
+    'magenta': 35,
+    'cyan': 36,
+    'white': 37,
+}
+
+ANSI_RESET = "\x1b[0m"
+
+class Viewport(NamedTuple):
+    """An inclusive rectangular window onto a coordinate system."""
+    min_x: int
+    max_x: int
+    min_y: int
+    max_y: int
+
+    @classmethod
+    def of(cls, coordinate_system) -> Optional["Viewport"]:
+        """The viewport spanning every cell written to ``coordinate_system``, ``None`` if empty."""
+        if coordinate_system.min_x is None:
+            return None
+        return cls(coordinate_system.min_x, coordinate_system.max_x,
+                   coordinate_system.min_y, coordinate_system.max_y)
+
+def _ansi_escape(color):
+    """Return the ANSI escape sequence for a named or ``(r, g, b)`` ``color``."""
+    if isinstance(color, str):
+        return f"\x1b[{ANSI_COLORS[color]}m"
+
+    r, g, b = color
+    return f"\x1b[38;2;{r};{g};{b}m"
+
+def iter_rows(coordinate_system, viewport):
+    """Yield the list of cell values of every row in ``viewport``, from ``max_y`` down to ``min_y``."""
+    get, fill = coordinate_system.data.get, coordinate_system.fill
+    xs = range(viewport.min_x, viewport.max_x + 1)
+    for y in range(viewport.max_y, viewport.min_y - 1, -1):
+        yield [get((x, y), fill) for x in xs]
+
+def render(coordinate_system, stream: TextIO = sys.stdout, *, viewport=None, palette=None):
+    """Write ``coordinate_system`` to the text ``stream`` one row at a time.
+
+    Only the cells within ``viewport`` are written, defaulting to every written cell. The optional
+    ``palette`` maps cell values to a named or ``(r, g, b)`` color, rendered as ANSI escapes.
+    """
+    viewport = viewport or Viewport.of(coordinate_system)
+    if viewport is None:
+        stream.write("Empty")
+        return
+
+    # Resolve the text of each distinct value only once
+    texts = {}
+    def to_text(value):
+        text = texts.get(value)
+        if text is None:
+            text = str(value)
+            if palette is not None and value in palette:
+                text = _ansi_escape(palette[value]) + text + ANSI_RESET
+            texts[value] = text
+        return text
+
+    for i, row in enumerate(iter_rows(coordinate_system, viewport)):
+        # Add a newline only in between rows
+        if i > 0:
+            stream.write("\n")
+        stream.write("".join(map(to_text, row)))
+
+def export_image(coordinate_system, path, palette, *, viewport=None):
+    """Export ``coordinate_system`` as a binary PGM or PPM image at ``path``.
+
+    The ``palette`` maps cell values to either an integer gray level, producing a PGM, or to an
+    ``(r, g, b)`` tuple, producing a PPM. Unmapped values are black.
+    """
+    viewport = viewport or Viewport.of(coordinate_system)
+    if viewport is None:
+        raise ValueError("Cannot export an empty coordinate system")
+
+    def is_level(level):
+        return isinstance(level, int) and 0 <= level <= 255
+
+    def is_rgb(color):
+        return isinstance(color, tuple) and len(color) == 3 and all(map(is_level, color))
+
+    # Sanity check the whole palette up front, as it determines the format of the image
+    grayscale = all(map(lambda color: isinstance(color, int), palette.values()))
+    is_color = is_level if grayscale else is_rgb
+    for value, color in palette.items():
+        if not is_color(color):
+            raise ValueError(f"The palette colors must all be gray levels in 0-255, or all (r, g, b) tuples of "
+                             f"them, not {color!r} of {value!r}")
+
+    black = b"\x00" if grayscale else b"\x00\x00\x00"
+    pixels = {value: bytes([color] if grayscale else color) for value, color in palette.items()}
+
+    width = viewport.max_x - viewport.min_x + 1
+    height = viewport.max_y - viewport.min_y + 1
+    with open(path, 'wb') as f:
+        f.write(f"{'P5' if grayscale else 'P6'}\n{width} {height}\n255\n".encode())
+
+        for row in iter_rows(coordinate_system, viewport):
+            f.write(b"".join(map(lambda value: pixels.get(value, black), row)))
@@ -0,0 +1,166 @@
+"""A content-addressed, on-disk cache of solution results.
+
+A result is keyed by the hash of everything it depends on: the source of the solution, the
+source of every ``advent_support`` module it imports, directly or transitively, the bytes of the
+input and the parts run. Any edit to any of them is a new key, so entries never go stale and are
+never invalidated, they are merely evicted least recently used first once the cache outgrows
+its size budget.
+"""
+import ast
+import hashlib
+import json
+import os
+from typing import Optional
+
+PACKAGE = __name__.split('.')[0]
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_DIR = os.path.join(os.path.expanduser('~'), '.cache', PACKAGE)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+def _module_path(name) -> Optional[str]:
+    """The source file of the ``advent_support`` module ``name``, ``None`` if it is not one."""
+    parts = name.split('.')
+    if parts[0] != PACKAGE:
+        return None
+
+    if len(parts) == 1:
+        return os.path.join(PACKAGE_DIR, '__init__.py')
+    path = os.path.join(PACKAGE_DIR, *parts[1:]) + '.py'
+    return path if os.path.exists(path) else None
+
+def _imported_modules(source, package=None) -> set[str]:
+    """The names of the ``advent_support`` modules imported by ``source``.
+
+    Relative imports are resolved against ``package``. Importing a submodule, or any name from a
+    package, also imports the package itself.
+    """
+    from . import _EXPORTS
+
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.add(alias.name)
+
+                # The package itself may be used to reach any of its lazily imported names
+                if alias.name == PACKAGE:
+                    names.update(f"{PACKAGE}.{module}" for module in _EXPORTS.values())
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package if node.module is None else f"{package}.{node.module}"
+            else:
+                base = node.module
+            names.add(base)
+
+            # Any of the imported names may themselves be submodules, such as `from . import snapshot`,
+            # or names the package imports lazily from its submodules
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+            if base == PACKAGE:
+                names.update(f"{PACKAGE}.{_EXPORTS[alias.name]}" for alias in node.names if alias.name in _EXPORTS)
+
+    modules = set()
+    for name in names:
+        parts = name.split('.')
+        modules.update('.'.join(parts[:i]) for i in range(1, len(parts) + 1))
+
+    return {name for name in modules if _module_path(name) is not None}
+
+def dependencies(source) -> dict[str, str]:
+    """Map every ``advent_support`` module ``source`` transitively imports to its source file."""
+    deps = {}
+    pending = list(_imported_modules(source))
+    while pending:
+        name = pending.pop()
+        if name in deps:
+            continue
+
+        deps[name] = _module_path(name)
+        with open(deps[name], 'r') as f:
+            pending.extend(_imported_modules(f.read(), package=PACKAGE))
+
+    return deps
+
+def _file_digest(path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def result_key(solution_path, input_path, parts) -> str:
+    """The content hash of a run of the solution at ``solution_path`` on ``input_path``."""
+    with open(solution_path, 'r') as f:
+        source = f.read()
+
+    h = hashlib.sha256()
+    h.update(hashlib.sha256(source.encode()).digest())
+    for name, path in sorted(dependencies(source).items()):
+        h.update(f"{name}:{_file_digest(path)}\n".encode())
+    h.update(f"input:{_file_digest(input_path)}\n".encode())
+    h.update(f"parts:{','.join(map(str, parts))}\n".encode())
+
+    return h.hexdigest()
+
+def evict_lru(directory, max_bytes, *, suffix):
+    """Remove the least recently used ``suffix`` files of ``directory`` until they fit within ``max_bytes``."""
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(suffix):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another process evicted it first
+            pass
+        total -= size
+
+class ResultCache():
+    """Stores results as small JSON files in ``directory``, using at most ``max_bytes`` of disk."""
+
+    def __init__(self, directory=DEFAULT_DIR, *, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key) -> Optional[list[dict]]:
+        """Return the results stored under ``key``, ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                results = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Mark the entry as recently used for the eviction
+        os.utime(path)
+        return results
+
+    def put(self, key, results: list[dict]):
+        """Store the ``results`` under ``key``, then evict entries beyond the size budget."""
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Write aside and rename, so that readers never see a partial entry
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(results, f)
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def evict(self):
+        evict_lru(self.directory, self.max_bytes, suffix='.json')
+
+    def clear(self):
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,165 @@
+"""Load and run the daily solutions, timing their phases separately.
+
+Every ``dayN/solution.py`` exposes a ``parse(path)`` function reading its puzzle input, and
+``part1(puzzle)`` and ``part2(puzzle)`` functions of the parsed puzzle. The parts never mutate
+the parsed puzzle, so they may be run any number of times, in any order.
+"""
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from functools import partial
+from numbers import Integral
+from typing import Any, NamedTuple, Optional
+
+from .result_cache import result_key
+
+PARTS = (1, 2)
+
+class PhaseResult(NamedTuple):
+    day: int
+    phase: str
+    seconds: float
+    answer: Any = None
+    cached: bool = False
+
+def solution_path(day, *, root='.'):
+    return os.path.join(root, f"day{day}", "solution.py")
+
+def available_days(root='.') -> list[int]:
+    """Return every day with a solution under ``root``, in order."""
+    days = []
+    for entry in os.listdir(root):
+        if re.fullmatch(r'day\d+', entry) and os.path.exists(solution_path(int(entry[3:]), root=root)):
+            days.append(int(entry[3:]))
+    return sorted(days)
+
+def load_solution(day, *, root='.'):
+    """Import the solution module of ``day`` from the ``dayN`` directories under ``root``."""
+    path = solution_path(day, root=root)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"There is no solution of day {day} at: {path}")
+
+    name = f"day{day}_solution"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+
+    # Register the module before executing it, as `dataclasses` and `pickle` look classes up by module
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
+
+def default_input(module):
+    """The ``INPUT_FILE`` of the solution ``module``, relative to its own directory."""
+    return os.path.join(os.path.dirname(module.__file__), module.INPUT_FILE)
+
+def has_part(module, part):
+    return callable(getattr(module, f"part{part}", None))
+
+def timed(fn, *args):
+    """Call ``fn`` with ``args``, returning its result and the wall time it took in seconds."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def run_solution(module, day, input_path, *, parts=PARTS, repeat=1, parse_cache=None) -> list[PhaseResult]:
+    """Run the parse and ``parts`` phases of the solution ``module`` ``repeat`` times.
+
+    Each phase reports its fastest wall time of the ``repeat`` runs. Parts which the solution
+    does not implement are skipped. Given a ``ParseCache``, the parse phase decodes the cached
+    artifact of the input whenever there is one.
+    """
+    if repeat < 1:
+        raise ValueError(f"Cannot repeat a run {repeat} times")
+
+    if parse_cache is None:
+        parse = module.parse
+    else:
+        parse = partial(parse_cache.parse, module, day)
+
+    parts = [part for part in parts if has_part(module, part)]
+    best = {}
+    answers = {}
+    for _ in range(repeat):
+        puzzle, seconds = timed(parse, input_path)
+        best['parse'] = min(best.get('parse', seconds), seconds)
+
+        for part in parts:
+            phase = f"part{part}"
+            answers[phase], seconds = timed(getattr(module, phase), puzzle)
+            best[phase] = min(best.get(phase, seconds), seconds)
+
+    return [PhaseResult(day, phase, seconds, answers.get(phase)) for phase, seconds in best.items()]
+
+def run_day(day, *, input_path=None, root='.', parts=PARTS, repeat=1, cache=None,
+            parse_cache=None) -> list[PhaseResult]:
+    """Load and run the solution of ``day``, see ``run_solution``.
+
+    Given a ``ResultCache``, the results of an identical earlier run are returned instead, marked
+    as ``cached``, and the results of a fresh run are stored. Repeated runs, which are asked for
+    fresh timings, bypass the ``ResultCache``.
+    """
+    module = load_solution(day, root=root)
+    if input_path is None:
+        input_path = default_input(module)
+
+    if cache is None or repeat > 1:
+        return run_solution(module, day, input_path, parts=parts, repeat=repeat, parse_cache=parse_cache)
+
+    key = result_key(solution_path(day, root=root), input_path, parts)
+    records = cache.get(key)
+    if records is not None:
+        return [PhaseResult(day, record['phase'], record['seconds'], record['answer'], cached=True)
+                for record in records]
+
+    results = run_solution(module, day, input_path, parts=parts, repeat=repeat, parse_cache=parse_cache)
+    cache.put(key, [{'phase': result.phase, 'seconds': result.seconds, 'answer': json_answer(result.answer)}
+                    for result in results])
+    return results
+
+def json_answer(answer):
+    """Convert an ``answer`` to a JSON serializable value, keeping integers as numbers."""
+    if answer is None or isinstance(answer, (bool, str)):
+        return answer
+    elif isinstance(answer, Integral):
+        return int(answer)
+    return str(answer)
+
+def results_record(results) -> dict:
+    """Summarize ``results`` as the JSON serializable ``seconds`` and ``answers`` of their phases."""
+    return {
+        'seconds': {result.phase: result.seconds for result in results},
+        'answers': {result.phase: json_answer(result.answer) for result in results if result.phase != 'parse'},
+    }
+
+def format_json(result: PhaseResult) -> str:
+    record = {'day': result.day, 'phase': result.phase, 'seconds': result.seconds}
+    if result.phase != 'parse':
+        record['answer'] = json_answer(result.answer)
+    if result.cached:
+        record['cached'] = True
+    return json.dumps(record)
+
+def format_text(result: PhaseResult) -> str:
+    line = f"day{result.day:<3} {result.phase:<6} {result.seconds * 1000:>10.3f} ms"
+    if result.cached:
+        line += " (cached)"
+    if result.phase == 'parse':
+        return line
+
+    # Multi-line answers, such as rendered letters, start on their own line
+    answer = str(result.answer)
+    return f"{line}\n{answer}" if '\n' in answer else f"{line}  {answer}"
+
+def print_results(results, *, fmt='text', stream: Optional[Any] = None):
+    stream = sys.stdout if stream is None else stream
+    formatter = format_json if fmt == 'json' else format_text
+    for result in results:
+        print(formatter(result), file=stream)
@@ -0,0 +1,215 @@
+"""Shortest path searches over grids, or any graph, with pluggable neighbor and cost functions.
+
+Every search takes an iterable of ``sources`` to start from simultaneously and a ``neighbors``
+function of a node. For the unweighted ``bfs`` it yields the neighboring nodes, for the weighted
+searches it yields ``(neighbor, cost)`` pairs. An optional ``goal`` predicate stops the search as
+soon as the shortest distance to a node satisfying it is known.
+
+The visited, distance and parent bookkeeping lives in flat lists when the graph is dense, given as
+an ``index`` function mapping every node to a unique integer below ``size``. Otherwise, such as for
+a ``LazyCoordinateSystem``, it falls back onto dictionaries keyed by the nodes themselves.
+"""
+from collections import deque
+from itertools import count
+from typing import Callable, Hashable, Iterable, Optional
+import heapq
+
+Node = Hashable
+
+class _DictState():
+    """Search bookkeeping keyed by the nodes themselves."""
+
+    def __init__(self):
+        self.dist = {}
+        self.parent = {}
+
+    def distance(self, node):
+        return self.dist.get(node)
+
+    def record(self, node, dist, parent):
+        self.dist[node] = dist
+        self.parent[node] = parent
+
+    def parent_of(self, node):
+        return self.parent.get(node)
+
+class _ArrayState():
+    """Search bookkeeping in flat lists indexed by ``index(node)``."""
+
+    def __init__(self, index, size):
+        self.index = index
+        self.dist = [None] * size
+        self.parent = [None] * size
+
+    def distance(self, node):
+        return self.dist[self.index(node)]
+
+    def record(self, node, dist, parent):
+        i = self.index(node)
+        self.dist[i] = dist
+        self.parent[i] = parent
+
+    def parent_of(self, node):
+        return self.parent[self.index(node)]
+
+def _make_state(index, size):
+    if index is None:
+        return _DictState()
+    elif size is None:
+        raise ValueError("A dense search `index` requires the `size` of the graph")
+    return _ArrayState(index, size)
+
+class SearchResult():
+    """The outcome of a search: shortest distances, the shortest path tree and any goal found."""
+
+    def __init__(self, state, goal=None):
+        self._state = state
+
+        self.goal = goal
+        """The first node found satisfying the ``goal`` predicate, ``None`` if none was."""
+
+    def distance(self, node) -> Optional[float]:
+        """The shortest distance from any source to ``node``, ``None`` if it was never reached."""
+        return self._state.distance(node)
+
+    def __contains__(self, node):
+        return self._state.distance(node) is not None
+
+    def path(self, node) -> list[Node]:
+        """Return the shortest path from its source up to and including ``node``."""
+        if node not in self:
+            raise ValueError(f"There exists no path to: {node}")
+
+        path = [node]
+        while (parent := self._state.parent_of(path[-1])) is not None:
+            path.append(parent)
+
+        # The `path` is in reverse order, simply reverse and return
+        return path[::-1]
+
+def bfs(
+        sources: Iterable[Node],
+        neighbors: Callable[[Node], Iterable[Node]],
+        *,
+        goal: Optional[Callable[[Node], bool]] = None,
+        index: Optional[Callable[[Node], int]] = None,
+        size: Optional[int] = None,
+) -> SearchResult:
+    """Breadth-first search of an unweighted graph."""
+    state = _make_state(index, size)
+    frontier = deque()
+    for source in sources:
+        if state.distance(source) is None:
+            state.record(source, 0, None)
+            frontier.append(source)
+
+            if goal is not None and goal(source):
+                return SearchResult(state, source)
+
+    while frontier:
+        node = frontier.popleft()
+        next_dist = state.distance(node) + 1
+        for next_node in neighbors(node):
+            if state.distance(next_node) is not None:
+                continue
+
+            state.record(next_node, next_dist, node)
+            if goal is not None and goal(next_node):
+                return SearchResult(state, next_node)
+            frontier.append(next_node)
+
+    return SearchResult(state)
+
+def bfs_01(
+        sources: Iterable[Node],
+        neighbors: Callable[[Node], Iterable[tuple[Node, int]]],
+        *,
+        goal: Optional[Callable[[Node], bool]] = None,
+        index: Optional[Callable[[Node], int]] = None,
+        size: Optional[int] = None,
+) -> SearchResult:
+    """Shortest paths of a graph whose edge costs are all either 0 or 1, using a double-ended queue."""
+    state = _make_state(index, size)
+    frontier = deque()
+    for source in sources:
+        state.record(source, 0, None)
+        frontier.append(source)
+
+    # The deque may hold stale entries of nodes since improved, skip them via `done`
+    done = _make_state(index, size)
+    while frontier:
+        node = frontier.popleft()
+        if done.distance(node) is not None:
+            continue
+        done.record(node, True, None)
+
+        if goal is not None and goal(node):
+            return SearchResult(state, node)
+
+        dist = state.distance(node)
+        for next_node, cost in neighbors(node):
+            next_dist = dist + cost
+            prev_dist = state.distance(next_node)
+            if prev_dist is not None and prev_dist <= next_dist:
+                continue
+
+            state.record(next_node, next_dist, node)
+            if cost == 0:
+                frontier.appendleft(next_node)
+            else:
+                frontier.append(next_node)
+
+    return SearchResult(state)
+
+def astar(
+        sources: Iterable[Node],
+        neighbors: Callable[[Node], Iterable[tuple[Node, float]]],
+        heuristic: Callable[[Node], float],
+        *,
+        goal: Optional[Callable[[Node], bool]] = None,
+        index: Optional[Callable[[Node], int]] = None,
+        size: Optional[int] = None,
+) -> SearchResult:
+    """A* search with a consistent ``heuristic`` lower bound of the remaining distance to the goal."""
+    state = _make_state(index, size)
+    done = _make_state(index, size)
+
+    # Ties are broken by insertion order so that nodes themselves are never compared
+    tie_breaker = count()
+    frontier = []
+    for source in sources:
+        state.record(source, 0, None)
+        heapq.heappush(frontier, (heuristic(source), next(tie_breaker), source))
+
+    while frontier:
+        _, _, node = heapq.heappop(frontier)
+        if done.distance(node) is not None:
+            continue
+        done.record(node, True, None)
+
+        if goal is not None and goal(node):
+            return SearchResult(state, node)
+
+        dist = state.distance(node)
+        for next_node, cost in neighbors(node):
+            next_dist = dist + cost
+            prev_dist = state.distance(next_node)
+            if prev_dist is not None and prev_dist <= next_dist:
+                continue
+
+            state.record(next_node, next_dist, node)
+            heapq.heappush(frontier, (next_dist + heuristic(next_node), next(tie_breaker), next_node))
+
+    return SearchResult(state)
+
+def dijkstra(
+        sources: Iterable[Node],
+        neighbors: Callable[[Node], Iterable[tuple[Node, float]]],
+        *,
+        goal: Optional[Callable[[Node], bool]] = None,
+        index: Optional[Callable[[Node], int]] = None,
+        size: Optional[int] = None,
+) -> SearchResult:
+    """Dijkstra's shortest paths of a graph with non-negative edge costs."""
+    # Dijkstra's algorithm is A* without any heuristic
+    return astar(sources, neighbors, lambda _: 0, goal=goal, index=index, size=size)
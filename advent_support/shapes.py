@@ -0,0 +1,90 @@
+"""Rasterize lines into cell keys and shapes into row spans.
+
+A span is a ``(y, x_start, x_stop)`` tuple covering the cells ``x_start <= x < x_stop`` of row ``y``.
+Operating on whole spans rather than single cells lets a coordinate system read or write a row
+of a shape in one shot.
+"""
+from itertools import groupby, pairwise
+from typing import Iterable, Iterator
+
+Span = tuple[int, int, int]
+
+# The sentinel of a missing cell, or of no value given, shared by the coordinate system and its
+# storages as they pass it to one another
+_MISSING = object()
+
+def line_keys(start, stop, step=None) -> list[tuple[int, int]]:
+    """Return the ``(x, y)`` keys along the line from ``start`` up to, but excluding, ``stop``.
+
+    The line must be horizontal, vertical or 45° diagonal. The ``step`` is either an integer
+    multiple of the unit step along the line or a vector along it, defaulting to the unit step.
+    All of the stepping is exact integer arithmetic.
+    """
+    x0, y0 = start
+    dx, dy = stop[0] - x0, stop[1] - y0
+
+    # Sanity check the line is axis-aligned or diagonal
+    if dx != 0 and dy != 0 and abs(dx) != abs(dy):
+        raise ValueError(f"Line from {start} to {stop} is not horizontal, vertical or diagonal")
+
+    unit_x, unit_y = (dx > 0) - (dx < 0), (dy > 0) - (dy < 0)
+    if step is None:
+        stride = 1
+    elif isinstance(step, int):
+        stride = step
+    else:
+        stride = max(abs(step[0]), abs(step[1]))
+        if (step[0], step[1]) != (unit_x * stride, unit_y * stride):
+            raise ValueError(f"Step {step} does not lay along the line from {start} to {stop}")
+
+    if stride <= 0:
+        raise ValueError(f"Step {step} must progress along the line")
+
+    # The number of cells is the ceiling of the line length over the `stride`
+    n = -(-max(abs(dx), abs(dy)) // stride)
+    sx, sy = unit_x * stride, unit_y * stride
+    return [(x0 + i * sx, y0 + i * sy) for i in range(n)]
+
+def diamond_spans(center, radius) -> Iterator[Span]:
+    """Yield the spans of every cell within Manhattan distance ``radius`` of ``center``."""
+    cx, cy = center
+    for dy in range(-radius, radius + 1):
+        half_width = radius - abs(dy)
+        yield cy + dy, cx - half_width, cx + half_width + 1
+
+def rect_spans(corner, opposite) -> Iterator[Span]:
+    """Yield the spans of the rectangle between the ``corner`` and ``opposite`` cells inclusive."""
+    min_x, max_x = sorted((corner[0], opposite[0]))
+    min_y, max_y = sorted((corner[1], opposite[1]))
+    for y in range(min_y, max_y + 1):
+        yield y, min_x, max_x + 1
+
+def polyline_spans(points) -> Iterator[Span]:
+    """Yield the spans of the horizontal, vertical or diagonal segments joining ``points`` inclusive."""
+    points = list(points)
+
+    # A single point is a degenerate polyline
+    if len(points) == 1:
+        x, y = points[0]
+        yield y, x, x + 1
+
+    for (x0, y0), (x1, y1) in pairwise(points):
+        if y0 == y1:
+            # A horizontal segment is a single span
+            yield y0, min(x0, x1), max(x0, x1) + 1
+        else:
+            # Otherwise every cell of the segment lays on its own row
+            stop = (x1 + (x1 > x0) - (x1 < x0), y1 + (y1 > y0) - (y1 < y0))
+            yield from map(lambda key: (key[1], key[0], key[0] + 1), line_keys((x0, y0), stop))
+
+def merge_spans(spans: Iterable[Span]) -> list[Span]:
+    """Sort the ``spans`` and merge any overlapping or touching spans of the same row."""
+    merged = []
+    for y, row_spans in groupby(sorted(spans), key=lambda span: span[0]):
+        for _, x_start, x_stop in row_spans:
+            if merged and merged[-1][0] == y and x_start <= merged[-1][2]:
+                merged[-1] = (y, merged[-1][1], max(merged[-1][2], x_stop))
+            else:
+                merged.append((y, x_start, x_stop))
+
+    return merged
@@ -0,0 +1,230 @@
+"""A compact binary snapshot format of coordinate system cells.
+
+The layout of a snapshot file is:
+
+* A fixed ``HEADER``: the magic, the payload layout, the code width, whether bounds are
+  present, the min/max x/y bounds and the number of records.
+* A length-prefixed JSON table holding the ``fill`` and the distinct cell ``values``. Cells
+  refer to their value by its 1-based code into this table. So that every value round-trips
+  exactly, the ``fill`` and the values must be ``str``, ``int``, ``float``, ``bool`` or ``None``,
+  anything else, even a ``tuple``, is rejected with a ``TypeError``. Values which compare equal
+  but are of different types, such as ``True`` and ``1``, are coded apart.
+* The payload, starting on an 8-byte boundary. A ``SPARSE`` payload holds the x, y and code
+  arrays of every cell sorted by (y, x). A ``DENSE`` payload holds the code of every cell of
+  the bounding box row by row, from ``min_y`` up, where 0 marks an unwritten cell.
+
+All integers are little-endian. The payload arrays may be memory-mapped and served lazily.
+"""
+import io
+import json
+import mmap
+import struct
+
+import numpy
+
+from .shapes import _MISSING
+
+MAGIC = b"LCS1"
+
+SPARSE = 0
+DENSE = 1
+
+HEADER = struct.Struct("<4sBB?xqqqqQ")
+
+# Choose the dense layout automatically when at least this fraction of the bounding box is written
+DENSE_THRESHOLD = 0.25
+
+# The types which round-trip through the JSON table exactly
+JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _check_scalar(value):
+    if type(value) not in JSON_SCALARS:
+        raise TypeError(f"A snapshot holds only str, int, float, bool or None values, not {value!r}")
+
+def _align(offset):
+    return (offset + 7) // 8 * 8
+
+def dump(f, data, fill, bounds, *, layout=None):
+    """Write the ``data`` cells, ``fill`` and ``(min_x, max_x, min_y, max_y)`` ``bounds`` to the binary file ``f``.
+
+    The ``layout`` is ``SPARSE`` or ``DENSE``, chosen by the density of the cells by default.
+    """
+    items = list(data.items())
+
+    # Assign every distinct value a 1-based code, 0 is reserved for unwritten cells. The values
+    # are told apart by their type as well, as `True == 1` and `1 == 1.0`
+    _check_scalar(fill)
+    codes = {}
+    for _, value in items:
+        _check_scalar(value)
+        codes.setdefault((type(value), value), len(codes) + 1)
+    code_dtype = numpy.dtype(numpy.uint16 if len(codes) < 2 ** 16 else numpy.uint32)
+
+    xs = numpy.fromiter((key[0] for key, _ in items), dtype=numpy.int64, count=len(items))
+    ys = numpy.fromiter((key[1] for key, _ in items), dtype=numpy.int64, count=len(items))
+    cs = numpy.fromiter((codes[(type(value), value)] for _, value in items), dtype=code_dtype, count=len(items))
+
+    has_bounds = bounds[0] is not None
+    min_x, max_x, min_y, max_y = bounds if has_bounds else (0, -1, 0, -1)
+    area = (max_x - min_x + 1) * (max_y - min_y + 1)
+
+    if layout is None:
+        layout = DENSE if has_bounds and len(items) >= DENSE_THRESHOLD * area else SPARSE
+
+    if layout == DENSE:
+        payload = numpy.zeros((max_y - min_y + 1, max_x - min_x + 1), dtype=code_dtype)
+        payload[ys - min_y, xs - min_x] = cs
+        payloads = [payload]
+    elif layout == SPARSE:
+        order = numpy.lexsort((xs, ys))
+        payloads = [xs[order], ys[order], cs[order]]
+    else:
+        raise ValueError(f"Unknown snapshot layout: {layout}")
+
+    table = json.dumps({'fill': fill, 'values': [value for _, value in codes]}).encode()
+    header_len = HEADER.size + 4 + len(table)
+
+    f.write(HEADER.pack(MAGIC, layout, code_dtype.itemsize, has_bounds,
+                        min_x, max_x, min_y, max_y, len(items)))
+    f.write(struct.pack("<I", len(table)))
+    f.write(table)
+    f.write(b"\0" * (_align(header_len) - header_len))
+
+    for payload in payloads:
+        f.write(payload.tobytes())
+
+def dumps(data, fill, bounds, *, layout=None) -> bytes:
+    """Return the snapshot of ``dump`` as ``bytes``."""
+    f = io.BytesIO()
+    dump(f, data, fill, bounds, layout=layout)
+    return f.getvalue()
+
+def save(path, data, fill, bounds, *, layout=None):
+    """Write the snapshot of ``dump`` to ``path``."""
+    with open(path, 'wb') as f:
+        dump(f, data, fill, bounds, layout=layout)
+
+def loads(buffer, *, lazy=True):
+    """Read the snapshot in the bytes-like ``buffer``, returning its ``(storage, fill, bounds)``.
+
+    When ``lazy``, the payload is served in place from the ``buffer`` by a read-only storage,
+    otherwise every cell is read into a ``dict``.
+    """
+    magic, layout, code_size, has_bounds, min_x, max_x, min_y, max_y, n = \
+        HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not a coordinate system snapshot")
+
+    table_len, = struct.unpack_from("<I", buffer, HEADER.size)
+    table = json.loads(bytes(buffer[HEADER.size + 4:HEADER.size + 4 + table_len]))
+    offset = _align(HEADER.size + 4 + table_len)
+
+    code_dtype = numpy.dtype(numpy.uint16 if code_size == 2 else numpy.uint32)
+    values = [None] + table['values']
+    bounds = (min_x, max_x, min_y, max_y) if has_bounds else (None, None, None, None)
+
+    def view(dtype, count, offset):
+        return numpy.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+
+    if layout == DENSE:
+        shape = (max_y - min_y + 1, max_x - min_x + 1) if has_bounds else (0, 0)
+        codes = view(code_dtype, shape[0] * shape[1], offset).reshape(shape)
+        storage = MappedDenseStorage(codes, values, min_x, min_y)
+    elif layout == SPARSE:
+        xs = view(numpy.int64, n, offset)
+        ys = view(numpy.int64, n, offset + 8 * n)
+        codes = view(code_dtype, n, offset + 16 * n)
+        storage = MappedSparseStorage(xs, ys, codes, values)
+    else:
+        raise ValueError(f"Unknown snapshot layout: {layout}")
+
+    if not lazy:
+        storage = dict(storage.items())
+
+    return storage, table['fill'], bounds
+
+def load(path, *, lazy=True):
+    """Read the snapshot at ``path``, see ``loads``.
+
+    When ``lazy``, the file is memory-mapped so that cells are only paged in when read, and
+    the pages are shared between every process loading the same snapshot.
+    """
+    with open(path, 'rb') as f:
+        if not lazy:
+            return loads(f.read(), lazy=False)
+
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return loads(buffer, lazy=True)
+
+class MappedStorage():
+    """Common functionality of the read-only, memory-mapped snapshot storages."""
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        raise TypeError("A memory-mapped snapshot is read-only, write to a copy-on-write layer over it")
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self):
+        return map(lambda item: item[0], self.items())
+
+    def copy(self):
+        # Copying materializes the cells into a writable `dict`
+        return dict(self.items())
+
+class MappedSparseStorage(MappedStorage):
+    """Serves the cells of a ``SPARSE`` snapshot by binary searching its sorted records."""
+
+    def __init__(self, xs, ys, codes, values):
+        self.xs, self.ys, self.codes = xs, ys, codes
+        self.values = values
+
+    def get(self, key, default=None):
+        x, y = key
+
+        # Narrow down to the records of row `y`, then search for `x` within it
+        lo = int(numpy.searchsorted(self.ys, y, side='left'))
+        hi = int(numpy.searchsorted(self.ys, y, side='right'))
+        i = lo + int(numpy.searchsorted(self.xs[lo:hi], x))
+        if i < hi and self.xs[i] == x:
+            return self.values[self.codes[i]]
+        return default
+
+    def __len__(self):
+        return len(self.codes)
+
+    def items(self):
+        values = self.values
+        return zip(zip(self.xs.tolist(), self.ys.tolist()), map(values.__getitem__, self.codes.tolist()))
+
+class MappedDenseStorage(MappedStorage):
+    """Serves the cells of a ``DENSE`` snapshot by direct indexing."""
+
+    def __init__(self, codes, values, origin_x, origin_y):
+        self.codes = codes
+        self.values = values
+        self.origin_x, self.origin_y = origin_x, origin_y
+
+    def get(self, key, default=None):
+        i, j = key[1] - self.origin_y, key[0] - self.origin_x
+        height, width = self.codes.shape
+        if 0 <= i < height and 0 <= j < width:
+            code = self.codes.item(i, j)
+            if code:
+                return self.values[code]
+        return default
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self.codes))
+
+    def items(self):
+        ys, xs = numpy.nonzero(self.codes)
+        values = map(self.values.__getitem__, self.codes[ys, xs].tolist())
+        return zip(zip((xs + self.origin_x).tolist(), (ys + self.origin_y).tolist()), values)
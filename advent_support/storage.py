@@ -0,0 +1,351 @@
+from abc import ABC, abstractmethod
+from itertools import repeat
+
+import numpy
+
+from .shapes import _MISSING
+
+class ArrayStorage(ABC):
+    """Common functionality of the NumPy array backed cell storages.
+
+    Mimics the subset of the ``dict`` interface used by ``LazyCoordinateSystem``,
+    keyed by ``(x, y)`` integer tuples. Writing a value which the ``dtype`` cannot hold without
+    loss, in the sense of ``numpy.can_cast``, raises a ``ValueError``.
+    """
+
+    def __init__(self, *, fill=None, dtype=None):
+        self.fill = fill
+
+        # Infer the smallest sensible `dtype` from the `fill` value if not supplied
+        self.dtype = numpy.dtype(dtype) if dtype is not None else numpy.asarray(fill).dtype
+
+        # An `object` array holds any value as it is, any other `dtype` would silently convert the
+        # values it cannot hold safely, such as truncating `5.5` to `5` or `"ab"` to `"a"`
+        self._checks_values = self.dtype.kind != 'O'
+
+        # The Python scalar types of which every value fits the `dtype`, found upon first write
+        self._safe_types = set()
+
+        # The bounds of the `str` and `int` values, which fit depending on their length or magnitude
+        self._max_len = self.dtype.itemsize // 4 if self.dtype.kind == 'U' else None
+        self._int_range = numpy.iinfo(self.dtype) if self.dtype.kind in 'iu' else None
+
+    def _check_value(self, value):
+        """Raise a ``ValueError`` if ``value`` cannot be stored in the ``dtype`` without loss."""
+        if not self._checks_values or type(value) in self._safe_types:
+            return
+
+        if type(value) is str and self._max_len is not None:
+            fits = len(value) <= self._max_len
+        elif type(value) is int and self._int_range is not None:
+            fits = self._int_range.min <= value <= self._int_range.max
+        elif type(value) in (bool, float) and numpy.can_cast(numpy.dtype(type(value)), self.dtype):
+            # Any value of the type fits, such as a `float` in a `float64` array
+            self._safe_types.add(type(value))
+            return
+        else:
+            fits = numpy.can_cast(numpy.min_scalar_type(value), self.dtype)
+
+        if not fits:
+            raise ValueError(f"Value {value!r} does not fit the storage dtype {self.dtype}")
+
+    @abstractmethod
+    def get(self, key, default=None):
+        ...
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self):
+        return map(lambda item: item[0], self.items())
+
+class DenseStorage(ArrayStorage):
+    """A dense 2-d array backed cell storage which grows in chunks as needed.
+
+    Trades speed for memory: reading or writing a single cell goes through NumPy scalar
+    conversions, which are slower than a ``dict`` lookup, but the cells take a fraction of the
+    memory of ``dict`` entries and their key tuples.
+    """
+
+    def __init__(self, *, fill=None, dtype=None, chunk=64):
+        super().__init__(fill=fill, dtype=dtype)
+        self.chunk = chunk
+
+        # The (x, y) of the array element at index [0, 0]. The array is indexed as [y, x]
+        self.origin_x = self.origin_y = 0
+        self._values = numpy.full((0, 0), fill, dtype=self.dtype)
+        self._written = numpy.zeros((0, 0), dtype=bool)
+
+    @property
+    def shape(self):
+        """Return the (width, height) of the currently allocated region."""
+        height, width = self._values.shape
+        return width, height
+
+    def _index(self, key):
+        """Convert an ``(x, y)`` key to an array index, ``None`` if it is out of bounds."""
+        x, y = key
+        i, j = y - self.origin_y, x - self.origin_x
+        height, width = self._values.shape
+        if 0 <= i < height and 0 <= j < width:
+            return i, j
+        return None
+
+    def _round_down(self, v):
+        return (v // self.chunk) * self.chunk
+
+    def _grow(self, x, y):
+        """Reallocate the arrays so that ``(x, y)`` lays within bounds."""
+        width, height = self.shape
+
+        if width == 0:
+            # Nothing is allocated yet, start with a single chunk around `(x, y)`
+            min_x, min_y = self._round_down(x), self._round_down(y)
+            max_x, max_y = min_x + self.chunk, min_y + self.chunk
+        else:
+            # Extend the current bounds out to the chunk containing `(x, y)`
+            min_x = min(self.origin_x, self._round_down(x))
+            min_y = min(self.origin_y, self._round_down(y))
+            max_x = max(self.origin_x + width, self._round_down(x) + self.chunk)
+            max_y = max(self.origin_y + height, self._round_down(y) + self.chunk)
+
+        values = numpy.full((max_y - min_y, max_x - min_x), self.fill, dtype=self.dtype)
+        written = numpy.zeros(values.shape, dtype=bool)
+
+        # Copy over the previous contents at their offset in the new arrays
+        off_i, off_j = self.origin_y - min_y, self.origin_x - min_x
+        values[off_i:off_i+height, off_j:off_j+width] = self._values
+        written[off_i:off_i+height, off_j:off_j+width] = self._written
+
+        self.origin_x, self.origin_y = min_x, min_y
+        self._values, self._written = values, written
+
+    # The accesses of single cells inline `_index`, as they are the hottest paths
+
+    def get(self, key, default=None):
+        i, j = key[1] - self.origin_y, key[0] - self.origin_x
+        height, width = self._values.shape
+        if 0 <= i < height and 0 <= j < width and self._written.item(i, j):
+            return self._values.item(i, j)
+        return default
+
+    def __setitem__(self, key, value):
+        if self._checks_values and type(value) not in self._safe_types:
+            self._check_value(value)
+
+        i, j = key[1] - self.origin_y, key[0] - self.origin_x
+        height, width = self._values.shape
+        if not (0 <= i < height and 0 <= j < width):
+            self._grow(*key)
+            i, j = key[1] - self.origin_y, key[0] - self.origin_x
+
+        self._values[i, j] = value
+        self._written[i, j] = True
+
+    def set_span(self, y, x_start, x_stop, value):
+        """Set ``value`` to the cells ``x_start <= x < x_stop`` of row ``y`` in one shot."""
+        self._check_value(value)
+
+        for x in (x_start, x_stop - 1):
+            if self._index((x, y)) is None:
+                self._grow(x, y)
+
+        i, j = self._index((x_start, y))
+        self._values[i, j:j + x_stop - x_start] = value
+        self._written[i, j:j + x_stop - x_start] = True
+
+    def count_span(self, y, x_start, x_stop, value=_MISSING):
+        """Count the written cells ``x_start <= x < x_stop`` of row ``y``, optionally only of ``value``."""
+        height, width = self._values.shape
+        i = y - self.origin_y
+        j_start, j_stop = max(x_start - self.origin_x, 0), min(x_stop - self.origin_x, width)
+        if not 0 <= i < height or j_start >= j_stop:
+            return 0
+
+        written = self._written[i, j_start:j_stop]
+        if value is not _MISSING:
+            written = written & (self._values[i, j_start:j_stop] == value)
+        return int(numpy.count_nonzero(written))
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self._written))
+
+    def items(self):
+        ys, xs = numpy.nonzero(self._written)
+        values = self._values[ys, xs].tolist()
+        return zip(zip((xs + self.origin_x).tolist(), (ys + self.origin_y).tolist()), values)
+
+    def copy(self):
+        inst = self.__class__.__new__(self.__class__)
+        inst.__dict__.update(self.__dict__)
+        inst._values = self._values.copy()
+        inst._written = self._written.copy()
+        return inst
+
+    @property
+    def nbytes(self):
+        """The number of bytes used by the underlying arrays."""
+        return self._values.nbytes + self._written.nbytes
+
+class TiledStorage(ArrayStorage):
+    """A sparse cell storage of fixed-size square array tiles, allocated upon first write.
+
+    Suited for huge, mostly-empty worlds whose bounding box is too large for a single array,
+    while keeping neighboring cells adjacent in memory.
+    """
+
+    def __init__(self, *, fill=None, dtype=None, tile_size=64):
+        super().__init__(fill=fill, dtype=dtype)
+        self.tile_size = tile_size
+
+        # Maps a `(tile_x, tile_y)` index to its `(values, written)` arrays indexed as [y, x]
+        self.tiles = {}
+
+    def _locate(self, key):
+        """Convert an ``(x, y)`` key to its tile index and the index within that tile."""
+        tile_x, j = divmod(key[0], self.tile_size)
+        tile_y, i = divmod(key[1], self.tile_size)
+        return (tile_x, tile_y), (i, j)
+
+    def get(self, key, default=None):
+        tile_idx, idx = self._locate(key)
+        tile = self.tiles.get(tile_idx)
+        if tile is None or not tile[1].item(idx):
+            return default
+        return tile[0].item(idx)
+
+    def _tile(self, tile_idx):
+        """Return the ``(values, written)`` arrays of the tile at ``tile_idx``, allocating it if needed."""
+        tile = self.tiles.get(tile_idx)
+        if tile is None:
+            shape = (self.tile_size, self.tile_size)
+            tile = self.tiles[tile_idx] = (
+                numpy.full(shape, self.fill, dtype=self.dtype),
+                numpy.zeros(shape, dtype=bool),
+            )
+        return tile
+
+    def __setitem__(self, key, value):
+        self._check_value(value)
+
+        tile_idx, idx = self._locate(key)
+        values, written = self._tile(tile_idx)
+        values[idx] = value
+        written[idx] = True
+
+    def _span_pieces(self, y, x_start, x_stop):
+        """Split a row span into its ``(tile_idx, i, j_start, j_stop)`` pieces, one per tile."""
+        tile_y, i = divmod(y, self.tile_size)
+        x = x_start
+        while x < x_stop:
+            tile_x, j = divmod(x, self.tile_size)
+            n = min(self.tile_size - j, x_stop - x)
+            yield (tile_x, tile_y), i, j, j + n
+            x += n
+
+    def set_span(self, y, x_start, x_stop, value):
+        """Set ``value`` to the cells ``x_start <= x < x_stop`` of row ``y``, one tile at a time."""
+        self._check_value(value)
+
+        for tile_idx, i, j_start, j_stop in self._span_pieces(y, x_start, x_stop):
+            values, written = self._tile(tile_idx)
+            values[i, j_start:j_stop] = value
+            written[i, j_start:j_stop] = True
+
+    def count_span(self, y, x_start, x_stop, value=_MISSING):
+        """Count the written cells ``x_start <= x < x_stop`` of row ``y``, optionally only of ``value``."""
+        count = 0
+        for tile_idx, i, j_start, j_stop in self._span_pieces(y, x_start, x_stop):
+            tile = self.tiles.get(tile_idx)
+            if tile is None:
+                continue
+
+            values, written = tile
+            written = written[i, j_start:j_stop]
+            if value is not _MISSING:
+                written = written & (values[i, j_start:j_stop] == value)
+            count += int(numpy.count_nonzero(written))
+
+        return count
+
+    def __len__(self):
+        return sum(int(numpy.count_nonzero(written)) for _, written in self.tiles.values())
+
+    def items(self):
+        # Walk the tiles in scanline order, row of tiles by row of tiles
+        for (tile_x, tile_y) in sorted(self.tiles, key=lambda t: (t[1], t[0])):
+            values, written = self.tiles[(tile_x, tile_y)]
+            ys, xs = numpy.nonzero(written)
+            xs = (xs + tile_x * self.tile_size).tolist()
+            ys = (ys + tile_y * self.tile_size).tolist()
+            yield from zip(zip(xs, ys), values[written].tolist())
+
+    def copy(self):
+        inst = self.__class__.__new__(self.__class__)
+        inst.__dict__.update(self.__dict__)
+        inst.tiles = {k: (values.copy(), written.copy()) for k, (values, written) in self.tiles.items()}
+        return inst
+
+    @property
+    def nbytes(self):
+        """The number of bytes used by the allocated tiles."""
+        return sum(values.nbytes + written.nbytes for values, written in self.tiles.values())
+
+class LayeredStorage():
+    """A copy-on-write view over a frozen ``base`` cell storage.
+
+    Writes land in an overlay ``dict`` while reads fall back onto the ``base``, which must no
+    longer be written to directly. Any number of layers may share the same ``base``.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.overlay = {}
+
+    def get(self, key, default=None):
+        value = self.overlay.get(key, _MISSING)
+        if value is _MISSING:
+            return self.base.get(key, default)
+        return value
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.overlay[key] = value
+
+    def set_span(self, y, x_start, x_stop, value):
+        self.overlay.update(zip(zip(range(x_start, x_stop), repeat(y)), repeat(value)))
+
+    def __contains__(self, key):
+        return key in self.overlay or key in self.base
+
+    def __len__(self):
+        return len(self.base) + sum(1 for key in self.overlay if key not in self.base)
+
+    def keys(self):
+        return map(lambda item: item[0], self.items())
+
+    def items(self):
+        yield from self.overlay.items()
+        yield from filter(lambda item: item[0] not in self.overlay, self.base.items())
+
+    def flatten(self):
+        """Return a new storage of the ``base``'s kind with all of the layers merged."""
+        merged = self.base.flatten() if isinstance(self.base, LayeredStorage) else self.base.copy()
+        for key, value in self.overlay.items():
+            merged[key] = value
+
+        return merged
+
+    def copy(self):
+        return self.flatten()
@@ -0,0 +1,130 @@
+from typing import Iterable
+
+import numpy
+
+from .coordinate_system import Vector, Coordinate
+
+class VectorArray():
+    """A struct-of-arrays batch of vectors, supporting the ``Vector`` math on all of them at once.
+
+    The x and y components are stored in two parallel NumPy arrays, ``int64`` unless any
+    component is a float.
+    """
+
+    def __init__(self, x, y):
+        x, y = self._as_component(x), self._as_component(y)
+
+        # Sanity check that the components line up
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError(f"Mismatched component shapes: {x.shape} and {y.shape}")
+
+        dtype = numpy.float64 if x.dtype.kind == 'f' or y.dtype.kind == 'f' else numpy.int64
+        self.x = x.astype(dtype, copy=False)
+        self.y = y.astype(dtype, copy=False)
+
+    @staticmethod
+    def _as_component(values) -> numpy.ndarray:
+        array = numpy.asarray(values)
+
+        # NumPy makes an empty sequence `float64` by default, not by its content
+        if array.size == 0 and not isinstance(values, numpy.ndarray):
+            return array.astype(numpy.int64)
+        return array
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> "VectorArray":
+        """Create a ``VectorArray`` from any iterable of ``Vector``s or ``Coordinate``s."""
+        vectors = list(vectors)
+        return cls([v.x for v in vectors], [v.y for v in vectors])
+
+    from_coordinates = from_vectors
+
+    def to_vectors(self) -> list[Vector]:
+        return list(map(Vector, self.x.tolist(), self.y.tolist()))
+
+    def to_coordinates(self) -> list[Coordinate]:
+        # Sanity check, coordinates are integral
+        if self.x.dtype.kind != 'i':
+            raise TypeError(f"Cannot convert a {self.x.dtype} VectorArray to coordinates")
+
+        return list(map(Coordinate, self.x.tolist(), self.y.tolist()))
+
+    @staticmethod
+    def _components(other):
+        """Return the x and y components of ``other`` for broadcasting, ``None`` if unsupported."""
+        if isinstance(other, (int, float, numpy.integer, numpy.floating)):
+            return other, other
+        elif isinstance(other, (Vector, VectorArray)):
+            return other.x, other.y
+        else:
+            return None
+
+    def _apply(self, op, other, reflected=False):
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+
+        other_x, other_y = components
+        if reflected:
+            return VectorArray(op(other_x, self.x), op(other_y, self.y))
+        return VectorArray(op(self.x, other_x), op(self.y, other_y))
+
+    def __add__(self, other):
+        return self._apply(numpy.add, other)
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._apply(numpy.subtract, other)
+
+    def __rsub__(self, other):
+        return self._apply(numpy.subtract, other, reflected=True)
+
+    def __mul__(self, other):
+        return self._apply(numpy.multiply, other)
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self._apply(numpy.true_divide, other)
+
+    def __neg__(self):
+        return VectorArray(-self.x, -self.y)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, idx):
+        # A single index produces a scalar `Vector`, anything else a sub-`VectorArray`
+        if isinstance(idx, (int, numpy.integer)):
+            return Vector(self.x[idx].item(), self.y[idx].item())
+        return VectorArray(self.x[idx], self.y[idx])
+
+    def __iter__(self):
+        return iter(self.to_vectors())
+
+    def __repr__(self):
+        return f"VectorArray(x={self.x!r}, y={self.y!r})"
+
+    @property
+    def length(self) -> numpy.ndarray:
+        return numpy.hypot(self.x, self.y)
+
+    @property
+    def manhattan(self) -> numpy.ndarray:
+        return numpy.abs(self.x) + numpy.abs(self.y)
+
+    @property
+    def norm(self) -> "VectorArray":
+        length = self.length
+        return VectorArray(self.x / length, self.y / length)
+
+    @property
+    def orthogonal(self) -> "VectorArray":
+        return VectorArray(-1 * self.y, self.x)
+
+    def dot(self, other) -> numpy.ndarray:
+        components = self._components(other)
+        if components is None:
+            raise TypeError(f"Cannot take the dot product of a VectorArray and a {type(other).__name__}")
+
+        other_x, other_y = components
+        return self.x * other_x + self.y * other_y
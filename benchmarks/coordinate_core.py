@@ -0,0 +1,85 @@
+"""Micro-benchmark of the fast paths of ``Coordinate`` against the generic ``Vector`` operations.
+
+Both types are backed by their ``(x, y)`` tuple, so the speedup is that of the ``Coordinate``
+fast paths over the ``dunder_broadcastable`` dispatch of ``Vector`` alone. It is not measured
+against the original dataclass ``Vector``, which no longer exists.
+
+The sand simulation mirrors ``Cave.pour_sand_part2`` of day 14, parameterized over the
+coordinate type. Run from the repository root, so that ``advent_support`` is importable,
+with: ``python -m benchmarks.coordinate_core``
+"""
+import random
+import time
+
+from advent_support import Vector, Coordinate, LazyCoordinateSystem
+
+SEED = 2022
+N_ARITHMETIC = 200_000
+
+def make_rock_paths(rng, n_paths=40):
+    """Create a random set of horizontal rock ledges beneath the sand source."""
+    paths = []
+    for _ in range(n_paths):
+        x, y = rng.randint(420, 580), -rng.randint(60, 90)
+        paths.append([(x + dx, y) for dx in range(rng.randint(3, 15))])
+    return paths
+
+def pour_sand(coord_cls, rock_paths):
+    cave = LazyCoordinateSystem(fill='.')
+    for path in rock_paths:
+        for x, y in path:
+            cave[coord_cls(x, y)] = '#'
+
+    # Below, below-left then below-right, as in `Cave.sand_move`
+    moves = [coord_cls(0, -1), coord_cls(-1, -1), coord_cls(1, -1)]
+    floor_y = cave.min_y - 2
+    source = coord_cls(500, 0)
+
+    n_grains = 0
+    while cave[source] == '.':
+        loc = source
+        while loc.y > floor_y + 1:
+            for move in moves:
+                if cave[loc + move] == '.':
+                    loc = loc + move
+                    break
+            else:
+                break
+
+        cave[loc] = 'o'
+        n_grains += 1
+
+    return n_grains
+
+def arithmetic(coord_cls):
+    step = coord_cls(1, -1)
+    seen = set()
+    c = coord_cls(0, 0)
+    for _ in range(N_ARITHMETIC):
+        c = c + step
+        seen.add(c)
+    return len(seen)
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    ret = fn(*args)
+    return ret, time.perf_counter() - start
+
+def main():
+    rock_paths = make_rock_paths(random.Random(SEED))
+
+    for name, fn, args in [
+            ("add + hash", arithmetic, ()),
+            ("sand simulation", pour_sand, (rock_paths,)),
+    ]:
+        legacy_ret, legacy_t = timed(fn, Vector, *args)
+        fast_ret, fast_t = timed(fn, Coordinate, *args)
+
+        # Sanity check that both coordinate types simulate the same thing
+        assert legacy_ret == fast_ret
+
+        print(f"{name:>16}: Vector {legacy_t:.3f}s, Coordinate {fast_t:.3f}s, "
+              f"speedup {legacy_t / fast_t:.2f}x")
+
+if __name__ == "__main__":
+    main()
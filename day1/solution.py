@@ -11,27 +11,34 @@ def to_groups(acc, val):
 
     return acc
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     groups = reduce(to_groups, lines, [[]])
 
     # Materialize the `calories_per_elf` to be used between Parts 1 and 2
-    calories_per_elf = list(map(sum, groups))
+    return list(map(sum, groups))
+
+def part1(calories_per_elf):
+    return max(calories_per_elf)
+
+def part2(calories_per_elf):
+    top_3_elves = sorted(calories_per_elf, reverse=True)[:3]
+    return sum(top_3_elves)
+
+def main():
+    calories_per_elf = parse(INPUT_FILE)
 
     #
     # Part 1
     #
-    max_elf = max(calories_per_elf)
-    print("Part 1:", max_elf)
+    print("Part 1:", part1(calories_per_elf))
 
     #
     # Part 2
     #
-    top_3_elves = sorted(calories_per_elf, reverse=True)[:3]
-    calories_top_3 = sum(top_3_elves)
-    print("Part 2:", calories_top_3)
+    print("Part 2:", part2(calories_per_elf))
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import re
+from array import array
 from typing import Any
 from enum import Enum, auto
 from dataclasses import dataclass
@@ -6,6 +7,9 @@ from itertools import count
 
 INPUT_FILE = "input.txt"
 
+# The version of the parsed form, see `advent_support.parse_cache`
+PARSER_VERSION = 1
+
 class Command(Enum):
     addx = auto()
     noop = auto()
@@ -98,32 +102,56 @@ class CPU:
         yield from self._perform_cycle()
 
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     # Materialize for parts 1 and 2
-    instructions = list(map(Instruction.from_string, lines))
-    
-    #
-    # Part 1
-    #
+    return list(map(Instruction.from_string, lines))
+
+def encode_parsed(instructions):
+    # Each instruction packs to its command and its argument, zero without one
+    packed = array('q')
+    for instr in instructions:
+        packed.extend((instr.cmd.value, instr.params[0] if instr.params else 0))
+    return packed.tobytes()
+
+def decode_parsed(data):
+    packed = array('q')
+    packed.frombytes(data)
+
+    instructions = []
+    for cmd, arg in zip(packed[::2], packed[1::2]):
+        cmd = Command(cmd)
+        instructions.append(Instruction(cmd, [arg] if cmd is Command.addx else []))
+    return instructions
+
+def part1(instructions):
     cycles_of_interest = count(20, step=40)
     cpu1 = CPU(instructions)
     
     # Iterate the `cpu` taking the elements at `cycles_of_interest`
-    signal_strength = sum(map(lambda s: s['counter'] * s['X'], cpu1.states_at(cycles_of_interest)))
-    print("Part 1: ", signal_strength)
+    return sum(map(lambda s: s['counter'] * s['X'], cpu1.states_at(cycles_of_interest)))
 
-    #
-    # Part 2
-    #
+def part2(instructions):
     # Print the CRT every `CRT_WIDTH` of cycles    
     cycles_of_interest = count(CPU.CRT_WIDTH, step=CPU.CRT_WIDTH)
     cpu2 = CPU(instructions)
 
-    crt = '\n'.join(map(lambda s: s['crt'], cpu2.states_at(cycles_of_interest)))
-    print(f"Part 2:\n{crt}")
+    return '\n'.join(map(lambda s: s['crt'], cpu2.states_at(cycles_of_interest)))
+
+def main():
+    instructions = parse(INPUT_FILE)
+    
+    #
+    # Part 1
+    #
+    print("Part 1: ", part1(instructions))
+
+    #
+    # Part 2
+    #
+    print(f"Part 2:\n{part2(instructions)}")
                 
 if __name__ == "__main__":
     main()
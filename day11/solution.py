@@ -1,24 +1,41 @@
+import hashlib
 import operator
 import re
+import struct
 import time
+from dataclasses import dataclass
 from functools import reduce
 from operator import mul
+from typing import Callable, Optional
 from more_itertools import consume
 
+from advent_support import Checkpointer
+
 INPUT_FILE = "input.txt"
 
-class MonkeyBase():
+# Set to a path to checkpoint part 2 every `CHECKPOINT_EVERY` rounds, resuming from it when present
+CHECKPOINT_FILE = None
+CHECKPOINT_EVERY = 1000
 
-    def __init__(self, identifier, items, worry_fn, test_mod, true_recipient, false_recipient):
-        self.identifier = identifier
-        self.items = items
-        self.worry_fn = worry_fn
-        self.test_mod = test_mod
-        self.true_recipient = true_recipient
-        self.false_recipient = false_recipient
+# Part 2 may be extended well beyond the 10_000 rounds of the puzzle when checkpointing
+PART2_ROUNDS = 10_000
 
-        # Initialize the inspection counter
-        self.n_inspections = 0
+# The digest of the input and the number of monkeys leading a serialized `MonkeyGang` state
+STATE_HEADER = struct.Struct('<32sQ')
+
+@dataclass(frozen=True)
+class MonkeySpec():
+    """The parsed description of a monkey, from which fresh monkeys are created by each part."""
+    identifier: int
+    items: tuple[int, ...]
+    worry_op: Callable[[int, int], int]
+
+    worry_op_val: Optional[int]
+    """The operand of the ``worry_op``, ``None`` for the old worry value itself."""
+
+    test_mod: int
+    true_recipient: int
+    false_recipient: int
 
     @staticmethod
     def match(regex, val, group_ids):
@@ -26,7 +43,7 @@ class MonkeyBase():
         if ret is None:
             raise ValueError(f"Failed to match '{val}' to '{regex}'")
         return tuple(ret.group(i) for i in group_ids)
-        
+
     @classmethod
     def from_description(cls, desc):
         lines = map(lambda s: s.strip(), desc.split('\n'))
@@ -40,22 +57,49 @@ class MonkeyBase():
         m_false_recipient, = cls.match(r'If false: throw to monkey (\d+)', next(lines), [1])
 
         # Finish parsing the respective values
-        monkey_id = int(m_monkey_id)
-        monkey_items = [int(v) for v in m_monkey_items.split(', ')]
-        get_worry_op_val = lambda v: v if m_worry_op_val == "old" else int(m_worry_op_val)
-        worry_op = operator.add if m_worry_op == '+' else operator.mul
-        test_mod = int(m_test_mod)
-        true_recipient = int(m_true_recipient)
-        false_recipient = int(m_false_recipient)
+        return cls(
+            identifier=int(m_monkey_id),
+            items=tuple(int(v) for v in m_monkey_items.split(', ')),
+            worry_op=operator.add if m_worry_op == '+' else operator.mul,
+            worry_op_val=None if m_worry_op_val == "old" else int(m_worry_op_val),
+            test_mod=int(m_test_mod),
+            true_recipient=int(m_true_recipient),
+            false_recipient=int(m_false_recipient),
+        )
+
+class MonkeyBase():
+
+    def __init__(self, identifier, items, worry_fn, test_mod, true_recipient, false_recipient):
+        self.identifier = identifier
+        self.items = items
+        self.worry_fn = worry_fn
+        self.test_mod = test_mod
+        self.true_recipient = true_recipient
+        self.false_recipient = false_recipient
+
+        # Initialize the inspection counter
+        self.n_inspections = 0
+
+    @classmethod
+    def from_spec(cls, spec):
+        worry_op, worry_op_val = spec.worry_op, spec.worry_op_val
+        if worry_op_val is None:
+            worry_fn = lambda v: worry_op(v, v)
+        else:
+            worry_fn = lambda v: worry_op(v, worry_op_val)
 
         return cls(
-            identifier=monkey_id,
-            items=monkey_items,
-            worry_fn=lambda v: worry_op(v, get_worry_op_val(v)),
-            test_mod=test_mod,
-            true_recipient=true_recipient,
-            false_recipient=false_recipient,
+            identifier=spec.identifier,
+            items=list(spec.items),
+            worry_fn=worry_fn,
+            test_mod=spec.test_mod,
+            true_recipient=spec.true_recipient,
+            false_recipient=spec.false_recipient,
         )
+
+    @classmethod
+    def from_description(cls, desc):
+        return cls.from_spec(MonkeySpec.from_description(desc))
     
     def throw_items(self):
         """Iterate through the monkey logic."""
@@ -86,8 +130,8 @@ class Part1Monkey(MonkeyBase):
 class Part2Monkey(MonkeyBase):
 
     @classmethod
-    def from_description(cls, desc, common_mod):
-        monkey = super().from_description(desc)
+    def from_spec(cls, spec, common_mod):
+        monkey = super().from_spec(spec)
 
         # Update the `worry_fn` to be limited to the space defined by `common_mod`
         monkey._orig_worry_fn = monkey.worry_fn
@@ -97,9 +141,12 @@ class Part2Monkey(MonkeyBase):
         
 class MonkeyGang():
 
-    def __init__(self, monkeys):
+    def __init__(self, monkeys, input_digest=bytes(32)):
         self.monkeys = monkeys
 
+        # Identifies the input of the `monkeys`, so that a state is never restored onto another input's
+        self.input_digest = input_digest
+
     def __iter__(self):
         return self
         
@@ -110,6 +157,38 @@ class MonkeyGang():
             for recipient, item in monkey.throw_items():
                 self.monkeys[recipient].items.append(item)
 
+    def advance(self):
+        """Perform a single round, see ``advent_support.checkpoint``."""
+        next(self)
+        return True
+
+    def dump_state(self):
+        """Serialize the items and inspection counts of every monkey, as little-endian integers."""
+        counts = [monkey.n_inspections for monkey in self.monkeys]
+        lengths = [len(monkey.items) for monkey in self.monkeys]
+        items = [item for monkey in self.monkeys for item in monkey.items]
+
+        values = counts + lengths + items
+        return STATE_HEADER.pack(self.input_digest, len(self.monkeys)) + struct.pack(f'<{len(values)}q', *values)
+
+    def load_state(self, payload):
+        """Restore the items and inspection counts serialized by ``dump_state``."""
+        input_digest, n_monkeys = STATE_HEADER.unpack_from(payload)
+        if input_digest != self.input_digest:
+            raise ValueError("The state is of the monkeys of another input")
+        if n_monkeys != len(self.monkeys):
+            raise ValueError(f"The state is of {n_monkeys} monkeys, not {len(self.monkeys)}")
+
+        n_values = (len(payload) - STATE_HEADER.size) // struct.calcsize('<q')
+        values = struct.unpack_from(f'<{n_values}q', payload, STATE_HEADER.size)
+        counts, lengths, items = values[:n_monkeys], values[n_monkeys:2 * n_monkeys], values[2 * n_monkeys:]
+
+        offset = 0
+        for monkey, n_inspections, length in zip(self.monkeys, counts, lengths):
+            monkey.n_inspections = n_inspections
+            monkey.items = list(items[offset:offset + length])
+            offset += length
+
     def __str__(self):
         ret = ''
         for monkey in self.monkeys:
@@ -122,33 +201,51 @@ class MonkeyGang():
         top_trouble_makers = sorted(map(lambda m: m.n_inspections, self.monkeys), reverse=True)
         return top_trouble_makers[0] * top_trouble_makers[1]
     
-def main():
-    with open(INPUT_FILE, 'r') as f:
-        monkey_descs = f.read().split('\n\n')
-
-    #
-    # Part 1
-    #
-    part1_monkeys = [Part1Monkey.from_description(md) for md in monkey_descs]
+def input_digest(monkey_specs):
+    """The SHA-256 digest of the puzzle input, by the monkey specs parsed from it."""
+    return hashlib.sha256('\n'.join(map(repr, monkey_specs)).encode()).digest()
+
+def parse(path):
+    with open(path, 'r') as f:
+        # The monkeys are mutated by playing, so only their specs are parsed, from which each part
+        # creates its monkeys afresh
+        return [MonkeySpec.from_description(desc) for desc in f.read().split('\n\n')]
+
+def part1(monkey_specs):
+    part1_monkeys = [Part1Monkey.from_spec(spec) for spec in monkey_specs]
     monkey_gang = MonkeyGang(part1_monkeys)
     
     # Play 20 rounds of monkey business
     consume(monkey_gang, 20)
-    print("Part 1: ", monkey_gang.monkey_business)
+    return monkey_gang.monkey_business
 
-    #
-    # Part 2
-    #
+def part2(monkey_specs):
     # Referencing the Chinese Remainder Theorem, since all monkey's mods are co-prime,
     # the worry of the items may be in the mathematical space (worry % (product of mods))
-    common_mod = reduce(mul, map(lambda m: m.test_mod, part1_monkeys), 1)
-    part2_monkeys = [Part2Monkey.from_description(md, common_mod) for md in monkey_descs]
+    common_mod = reduce(mul, map(lambda spec: spec.test_mod, monkey_specs), 1)
+    part2_monkeys = [Part2Monkey.from_spec(spec, common_mod) for spec in monkey_specs]
     
-    monkey_gang = MonkeyGang(part2_monkeys)
+    monkey_gang = MonkeyGang(part2_monkeys, input_digest(monkey_specs))
     
-    # Play 10_000 rounds of monkey business
-    consume(monkey_gang, 10_000)
-    print("Part 2: ", monkey_gang.monkey_business)
+    # Play `PART2_ROUNDS` rounds of monkey business
+    if CHECKPOINT_FILE is None:
+        consume(monkey_gang, PART2_ROUNDS)
+    else:
+        Checkpointer(CHECKPOINT_FILE, every=CHECKPOINT_EVERY).run(monkey_gang, PART2_ROUNDS)
+    return monkey_gang.monkey_business
+
+def main():
+    monkey_specs = parse(INPUT_FILE)
+
+    #
+    # Part 1
+    #
+    print("Part 1: ", part1(monkey_specs))
+
+    #
+    # Part 2
+    #
+    print("Part 2: ", part2(monkey_specs))
     
 if __name__ == "__main__":
     main()
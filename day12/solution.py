@@ -4,6 +4,8 @@ from enum import Enum
 from itertools import starmap
 from functools import singledispatchmethod
 
+from advent_support.search import bfs
+
 INPUT_FILE = "input.txt"
 
 # Create a hashable dataclass
@@ -158,6 +160,38 @@ class GridSolver(Grid):
                     self._grid[r][c] = ord('a')                    
                     self.s_loc = Coordinate(r, c)
 
+    @classmethod
+    def from_char_grid(cls, char_grid):
+        """Create a ``GridSolver`` from a ``CharGrid`` of altitudes, converted in a vectorized pass."""
+        inst = cls.__new__(cls)
+
+        # The start has the height `a` and the end has the height `z`
+        Grid.__init__(inst, char_grid.remap({'S': 'a', 'E': 'z'}).tolist())
+        inst.s_loc = Coordinate(*char_grid.find('S')[0])
+        inst.e_loc = Coordinate(*char_grid.find('E')[0])
+
+        return inst
+
+    def _index(self, loc):
+        """Flatten ``loc`` to a unique index for the dense search bookkeeping."""
+        return loc.r * self.ncols + loc.c
+
+    def _next_locations(self, loc, *, movement=Movement.Forwards):
+        """Yield every location which may be stepped to from ``loc`` in the ``movement`` direction."""
+        for direction in Directions:
+            next_loc = loc + direction.value
+
+            # Skip this location if it is out-of-bounds
+            if not (0 <= next_loc.r < self.nrows and 0 <= next_loc.c < self.ncols):
+                continue
+
+            # Skip this location if the move `next_loc` -> `loc` exceeds the climbing restrictions
+            climbing_diff = self[next_loc] - self[loc]
+            if movement * climbing_diff > 1:
+                continue
+
+            yield next_loc
+
     def _solve_frontiers_set_helper(self, frontiers_set, *, frontier, movement=Movement.Forwards):
         """Solves for and records all newly discovered locations during the current ``frontier``.
         
@@ -171,18 +205,7 @@ class GridSolver(Grid):
         
         next_locs = set()
         for prev_frontier_loc in prev_frontier_locs:
-            for direction in Directions:
-                next_loc = prev_frontier_loc + direction.value
-                
-                # Skip this location if it is out-of-bounds
-                if not (0 <= next_loc.r < self.nrows and 0 <= next_loc.c < self.ncols):
-                    continue
-
-                # Skip this location if the move `next_loc` -> `prev_frontier_loc` exceeds the climbing restrictions
-                climbing_diff = self[next_loc] - self[prev_frontier_loc]
-                if movement * climbing_diff > 1:
-                    continue
-
+            for next_loc in self._next_locations(prev_frontier_loc, movement=movement):
                 # Record the `next_loc` and its parent `prev_frontier_loc` only if is has not been discovered yet
                 if next_loc not in frontiers_set:
                     next_locs.add((next_loc, prev_frontier_loc))
@@ -204,22 +227,32 @@ class GridSolver(Grid):
 
         return frontiers_set
     
+    def _search(self, start, goal, *, movement=Movement.Forwards):
+        """Breadth-first search from ``start`` until reaching a location satisfying ``goal``."""
+        return bfs(
+            [start],
+            lambda loc: self._next_locations(loc, movement=movement),
+            goal=goal,
+            index=self._index,
+            size=self.nrows * self.ncols,
+        )
+
     def solve(self):
-        frontiers_set = self._solve_frontiers_set(self.s_loc, self.e_loc)
+        result = self._search(self.s_loc, lambda loc: loc == self.e_loc)
 
-        if not frontiers_set:
-            assert ValueError(f"There exists no valid path between: {self.s_loc} -> {self.e_loc}")
-            
-        return frontiers_set[self.e_loc]
+        if result.goal is None:
+            raise ValueError(f"There exists no valid path between: {self.s_loc} -> {self.e_loc}")
+
+        return result.distance(self.e_loc)
 
     def solve_until_nearest_start(self):
-        frontier = 0
-        frontiers_set = FrontiersSet(initial=[(self.e_loc, None, frontier)])
-        while frontiers_set and not any(starmap(lambda loc, _: self[loc] == ord('a'), frontiers_set)):
-            frontier += 1
-            frontiers_set = self._solve_frontiers_set_helper(frontiers_set, frontier=frontier, movement=Movement.Backwards)
+        # Search backwards from the end until reaching any location of altitude 'a'
+        result = self._search(self.e_loc, lambda loc: self[loc] == ord('a'), movement=Movement.Backwards)
 
-        return frontier
+        if result.goal is None:
+            raise ValueError(f"There exists no valid path from any start -> {self.e_loc}")
+
+        return result.distance(result.goal)
     
     def solve_all_starts(self):
         solutions_grid = Grid([[None] * self.ncols] * self.nrows)
@@ -260,21 +293,31 @@ class GridSolver(Grid):
         yield from filter(lambda pair: pair[1] is not None, solutions_grid)
         
     
-def main():
-    with open(INPUT_FILE, 'r') as f:
-        lines = map(lambda s: s.rstrip('\n'), f.readlines())
+def parse(path):
+    # Imported upon parsing, so that merely importing the solution does not import NumPy
+    from advent_support import load_char_grid
+
+    with load_char_grid(path) as char_grid:
+        return GridSolver.from_char_grid(char_grid)
 
-    grid_solver = GridSolver(lines)
+def part1(grid_solver):
+    return grid_solver.solve()
+
+def part2(grid_solver):
+    return grid_solver.solve_until_nearest_start()
+
+def main():
+    grid_solver = parse(INPUT_FILE)
     
     #
     # Part 1
     #   
-    print("Part 1: ", grid_solver.solve())
+    print("Part 1: ", part1(grid_solver))
 
     #
     # Part 2
     #
-    print("Part 2: ", grid_solver.solve_until_nearest_start())
+    print("Part 2: ", part2(grid_solver))
 
     # The less efficient forward search algorithm
     #solutions = grid_solver.solve_all_starts()
@@ -1,4 +1,5 @@
 import re
+from array import array
 from enum import Enum, auto
 from itertools import starmap, combinations, pairwise
 from more_itertools import chunked, locate
@@ -7,6 +8,13 @@ from operator import mul, lt
 
 INPUT_FILE = "input.txt"
 
+# The version of the parsed form, see `advent_support.parse_cache`
+PARSER_VERSION = 1
+
+# The tokens of the flat encoding of packets, whose integers are never negative
+OPEN_TOKEN = -1
+CLOSE_TOKEN = -2
+
 # Make the Integrity also a monad
 class Integrity(Enum):
     Correct = auto()
@@ -182,23 +190,57 @@ class ListParser():
             self.accumulator.append(val)
     
     
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = filter(lambda l: l != '', map(lambda s: s.rstrip('\n'), f.readlines()))
-    packets = list(map(lambda line: ListParser.from_string(line).resolve(), lines))
+    return list(map(lambda line: ListParser.from_string(line).resolve(), lines))
 
-    #
-    # Part 1
-    #
+def encode_parsed(packets):
+    tokens = array('q')
+
+    def encode(value):
+        if type(value) is int:
+            tokens.append(value)
+        else:
+            tokens.append(OPEN_TOKEN)
+            for v in value:
+                encode(v)
+            tokens.append(CLOSE_TOKEN)
+
+    for packet in packets:
+        encode(packet._contents)
+    return tokens.tobytes()
+
+def decode_parsed(data):
+    tokens = array('q')
+    tokens.frombytes(data)
+
+    packets = []
+
+    # The lists still open, innermost last
+    stack = []
+    for token in tokens:
+        if token == OPEN_TOKEN:
+            stack.append([])
+        elif token == CLOSE_TOKEN:
+            value = stack.pop()
+            if stack:
+                stack[-1].append(value)
+            else:
+                packets.append(Packet(value))
+        else:
+            stack[-1].append(token)
+
+    return packets
+
+def part1(packets):
     # Packets in the correct order will respond positively to `left_packet < right_packet`
     correct_integrities = starmap(lt, chunked(packets, n=2))
 
     # Convert the correct integrity indices to 1-indexed
-    print("Part 1: ", sum(map(lambda i: i + 1, locate(correct_integrities))))
+    return sum(map(lambda i: i + 1, locate(correct_integrities)))
 
-    #
-    # Part 2
-    #
+def part2(packets):
     DIVIDER_PACKETS = [Packet([[2]]), Packet([[6]])]
     ordered_packets = sorted(packets + DIVIDER_PACKETS)
 
@@ -206,7 +248,20 @@ def main():
     divider_locations = map(lambda idx: idx + 1, locate(ordered_packets, lambda packet: packet in DIVIDER_PACKETS))
 
     # Multiple all of the divider locations together
-    print("Part 2: ", reduce(mul, divider_locations, 1))
+    return reduce(mul, divider_locations, 1)
+
+def main():
+    packets = parse(INPUT_FILE)
+
+    #
+    # Part 1
+    #
+    print("Part 1: ", part1(packets))
+
+    #
+    # Part 2
+    #
+    print("Part 2: ", part2(packets))
     
 if __name__ == "__main__":
     main()
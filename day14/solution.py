@@ -1,10 +1,23 @@
+import hashlib
 import re
+import struct
+from array import array
 from itertools import starmap, pairwise
 from more_itertools import ilen
 
-from advent_support import Coordinate, Direction, LazyCoordinateSystem
+from advent_support import Checkpointer, Coordinate, Direction, LazyCoordinateSystem, Stencil
 
 INPUT_FILE = "input.txt"    
+
+# Set to a path to checkpoint part 2 every `CHECKPOINT_EVERY` grains, resuming from it when present
+CHECKPOINT_FILE = None
+CHECKPOINT_EVERY = 5000
+
+# The version of the parsed form, see `advent_support.parse_cache`
+PARSER_VERSION = 2
+
+# The digest of the rock paths and the part 2 floor, if any, leading a serialized `Cave` state
+STATE_HEADER = struct.Struct('<32s?q')
     
 class Cave(LazyCoordinateSystem):
 
@@ -14,17 +27,21 @@ class Cave(LazyCoordinateSystem):
         # Insert the `sand_source`
         self.sand_source = Coordinate(500, 0)
         self[self.sand_source] = '+'
+
+        # The floor of part 2, fixed by the rocks alone before any sand is poured
+        self.floor_y = None
+
+        # The rock paths inserted, kept for `encode_parsed`
+        self.rock_paths = []
         
-    def insert_rock_path(self, start, end):
-        """Insert a straight rock path from ``start`` to ``end`` inclusive."""
-        vector = end - start
+    def insert_rock_path(self, coords):
+        """Insert a rock path of straight lines joining ``coords`` inclusive."""
+        # Sanity check that the path is made up of horizontal or vertical lines
+        assert all(starmap(lambda start, end: any(map(lambda p: p == 0, end - start)), pairwise(coords)))
 
-        # Sanity check that the path is either horizontal or vertical
-        assert any(map(lambda p: p == 0, vector))
+        self.rock_paths.append(coords)
 
-        # Normalize the vector
-        norm_vector = vector.norm
-        self[start:end+norm_vector] = '#'
+        self.fill_polyline(coords, '#')
 
     @staticmethod
     def sand_move(spots):
@@ -51,7 +68,7 @@ class Cave(LazyCoordinateSystem):
             # The sand must be above the lowest level of rocks,
             # otherwise it will fall indefinitely
             while sand_loc.y > min_y:
-                below = self[slice(sand_loc + Direction.SW.value, sand_loc + Direction.SE.value + Direction.E.value)]
+                below = self.neighbors(sand_loc, Stencil.BELOW)
                 sand_move = self.sand_move(below)
 
                 # Mark the sand down as it has settled
@@ -67,49 +84,108 @@ class Cave(LazyCoordinateSystem):
                 # The sand never settled and fell off indefinitely
                 break
 
-    def pour_sand_part2(self):
+    def drop_grain_part2(self):
+        """Drop a single grain of sand onto the floor, returning where it settled."""
         # The floor is 2 units below the lowest rock path
-        min_y = self.min_y - 2
-        
-        source_blocked = False
-        while not source_blocked:
-            sand_loc = self.sand_source
-        
-            while True:
-                below = self[slice(sand_loc + Direction.SW.value, sand_loc + Direction.SE.value + Direction.E.value)]
-                sand_move = self.sand_move(below)
+        if self.floor_y is None:
+            self.floor_y = self.min_y - 2
 
-                # Mark the sand down as it has settled. This is if it is stopped or directly above the floor
-                if sand_move is Direction.STOP or sand_loc.y == min_y + 1:
-                    # If the `sand_loc` is at the `self.sand_source`, it blocks it
-                    if sand_loc == self.sand_source:
-                        source_blocked = True
-                    
-                    # Yield and mark this sand particle
-                    yield sand_loc                    
-                    self[sand_loc] = 'o'
-                    
-                    break
-                else:
-                    sand_loc += sand_move.value           
-            
+        sand_loc = self.sand_source
+        while True:
+            below = self.neighbors(sand_loc, Stencil.BELOW)
+            sand_move = self.sand_move(below)
+
+            # Mark the sand down as it has settled. This is if it is stopped or directly above the floor
+            if sand_move is Direction.STOP or sand_loc.y == self.floor_y + 1:
+                self[sand_loc] = 'o'
+                return sand_loc
+            else:
+                sand_loc += sand_move.value
+
+    def pour_sand_part2(self):
+        # Pour until a grain settles onto the `self.sand_source`, blocking it
+        while self[self.sand_source] != 'o':
+            yield self.drop_grain_part2()
+
+    def advance(self):
+        """Drop a single grain of part 2, see ``advent_support.checkpoint``."""
+        if self[self.sand_source] == 'o':
+            return False
+
+        self.drop_grain_part2()
+        return True
+
+    @property
+    def input_digest(self):
+        """The SHA-256 digest of the puzzle input, by the rock paths parsed from it."""
+        return hashlib.sha256(repr(self.rock_paths).encode()).digest()
+
+    def dump_state(self):
+        """Serialize the floor and every cell of the cave."""
+        has_floor = self.floor_y is not None
+        return STATE_HEADER.pack(self.input_digest, has_floor, self.floor_y if has_floor else 0) + self.to_bytes()
+
+    def load_state(self, payload):
+        """Restore the floor and cells serialized by ``dump_state``."""
+        input_digest, has_floor, floor_y = STATE_HEADER.unpack_from(payload)
+        if input_digest != self.input_digest:
+            raise ValueError("The state is of the cave of another input")
+
+        self.floor_y = floor_y if has_floor else None
+        self.restore_bytes(payload[STATE_HEADER.size:])
     
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
     line_coords = [list(starmap(Coordinate.from_string, re.findall(r'(\d+),(\d+)', l))) for l in lines]
 
     orig_cave = Cave()
     
     for coords in line_coords:
-        for start_coord, end_coord in pairwise(coords):
-            orig_cave.insert_rock_path(start_coord, end_coord)
-            
+        orig_cave.insert_rock_path(coords)
+
+    return orig_cave
+
+def encode_parsed(orig_cave):
+    # Store the rock paths rather than the cells, so that decoding redraws a plain dict backed cave,
+    # each path packing to its number of points followed by their coordinates
+    packed = array('q')
+    for coords in orig_cave.rock_paths:
+        packed.append(len(coords))
+        for coord in coords:
+            packed.extend(coord)
+    return packed.tobytes()
+
+def decode_parsed(data):
+    packed = array('q')
+    packed.frombytes(data)
+
+    orig_cave = Cave()
+    i = 0
+    while i < len(packed):
+        n = packed[i]
+        points = packed[i + 1:i + 1 + 2 * n]
+        orig_cave.insert_rock_path([Coordinate(x, y) for x, y in zip(points[::2], points[1::2])])
+        i += 1 + 2 * n
+
+    return orig_cave
+
+def part1(orig_cave):
     cave_part1 = orig_cave.copy()        
-    print("Part 1: ", ilen(cave_part1.pour_sand_part1()))
-    
+    return ilen(cave_part1.pour_sand_part1())
+
+def part2(orig_cave):
     cave_part2 = orig_cave.copy()
-    print("Part 2: ", ilen(cave_part2.pour_sand_part2()))
+    if CHECKPOINT_FILE is None:
+        return ilen(cave_part2.pour_sand_part2())
+    else:
+        return Checkpointer(CHECKPOINT_FILE, every=CHECKPOINT_EVERY).run(cave_part2)
+
+def main():
+    orig_cave = parse(INPUT_FILE)
+            
+    print("Part 1: ", part1(orig_cave))
+    print("Part 2: ", part2(orig_cave))
     
 if __name__ == "__main__":
     main()
@@ -15,7 +15,7 @@ peekable_function = make_decorator(peekable)
 class Cave(LazyCoordinateSystem):
 
     def __init__(self, sensors_and_beacons: tuple[Coordinate, Coordinate]):
-        super().__init__(fill='.')
+        super().__init__(fill='.', indexed=True)
         
         self.sensors_and_beacons = sensors_and_beacons
         
@@ -97,8 +97,8 @@ class Cave(LazyCoordinateSystem):
         consume(self.map_flower(op, origin, stop_pred, step))
             
             
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     sensors_and_beacons = []
@@ -110,32 +110,35 @@ def main():
         sensors_and_beacons.append((Coordinate.from_string(res.group(1), res.group(2)),
                                     Coordinate.from_string(res.group(3), res.group(4))))
 
-    orig_cave = Cave(sensors_and_beacons)
-    
-    #
-    # Part 1
-    #
-    cave_part1 = orig_cave.copy()
+    return Cave(sensors_and_beacons)
+
+def part1(orig_cave):
+    # Imported upon solving, so that merely importing the solution does not import NumPy
+    from advent_support import VectorArray, IntervalSet
+
     row_of_interest = -2_000_000
-    
-    def mark_non_beacon(cave, coord):
-        if cave[coord] == '.':
-            cave[coord] = '#'
-    
-    for sensor, beacon in cave_part1.sensors_and_beacons:
-        manhattan_dist = (beacon - sensor).manhattan
 
-        # Find the point on the `row_of_interest`
-        point = Vector(sensor.x, row_of_interest)
+    # Compute all of the sensor to beacon distances in one batch
+    sensors = VectorArray.from_coordinates(map(lambda sb: sb[0], orig_cave.sensors_and_beacons))
+    beacons = VectorArray.from_coordinates(map(lambda sb: sb[1], orig_cave.sensors_and_beacons))
+    manhattan_dists = (beacons - sensors).manhattan
+
+    # Each sensor covers a span of the `row_of_interest` reaching as far as its distance left over
+    # after reaching the row. Sensors which do not reach the row produce empty spans
+    reach = manhattan_dists - abs(sensors.y - row_of_interest)
+    covered = IntervalSet.from_arrays(sensors.x - reach, sensors.x + reach + 1)
 
-        # Apply a horizontal linear map, marking only this row
-        cave_part1.apply_linear(
-            mark_non_beacon,
-            point,
-            lambda c: (c - sensor).manhattan > manhattan_dist
-        )
+    # The sensors and beacons are the only cells in the cave, and they are not counted
+    n_occupied = ilen(filter(lambda c: c.x in covered, orig_cave.cells_in_row(row_of_interest)))
+    return covered.length - n_occupied
 
-    print("Part 1: ", ilen(filter(lambda v: v[0].y == row_of_interest and v[1] == '#', cave_part1)))
+def main():
+    orig_cave = parse(INPUT_FILE)
+    
+    #
+    # Part 1
+    #
+    print("Part 1: ", part1(orig_cave))
             
         
 if __name__ == "__main__":
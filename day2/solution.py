@@ -52,26 +52,33 @@ def calculate_score_part2(game):
 
     return score_table[game[0]][game[1]]
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     # Materialize for both parts 1 and 2 
-    games = list(map(lambda l: l.split(), lines))
+    return list(map(lambda l: l.split(), lines))
+
+def part1(games):
+    scores = map(calculate_score_part1, games)    
+    return sum(scores)    
+
+def part2(games):
+    scores = map(calculate_score_part2, games)    
+    return sum(scores)    
+
+def main():
+    games = parse(INPUT_FILE)
 
     #
     # Part 1
     #
-    scores = map(calculate_score_part1, games)    
-    total_score = sum(scores)    
-    print(total_score)
+    print(part1(games))
 
     #
     # Part 2
     #
-    scores = map(calculate_score_part2, games)    
-    total_score = sum(scores)    
-    print(total_score)
+    print(part2(games))
     
 if __name__ == "__main__":
     main()
@@ -21,27 +21,35 @@ def get_priority(c):
     else:
         raise ValueError(f"The character {c=} is out of range.")
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         # Materialize to share between parts 1 and 2
-        lines = list(map(lambda s: s.rstrip('\n'), f.readlines()))
+        return list(map(lambda s: s.rstrip('\n'), f.readlines()))
 
+def part1(lines):
     compartments = map(parse_to_compartments, lines)
     overlaps = map(lambda c: c[0].intersection(c[1]), compartments)
     priorities = map(lambda c: sum(map(get_priority, c)), overlaps)
+    return sum(priorities)
+
+def part2(lines):
+    groups = chunked(lines, 3)
+    badges = map(lambda g: set(g[0]).intersection(*g[1:]), groups)
+    priorities = map(lambda c: sum(map(get_priority, c)), badges)
+    return sum(priorities)
+
+def main():
+    lines = parse(INPUT_FILE)
 
     #
     # Part 1
     #
-    print("Part 1:", sum(priorities))
+    print("Part 1:", part1(lines))
 
     #
     # Part 2
     #
-    groups = chunked(lines, 3)
-    badges = map(lambda g: set(g[0]).intersection(*g[1:]), groups)
-    priorities = map(lambda c: sum(map(get_priority, c)), badges)
-    print("Part 2:", sum(priorities))
+    print("Part 2:", part2(lines))
     
 if __name__ == "__main__":
     main()
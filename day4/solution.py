@@ -1,7 +1,11 @@
+from array import array
 from functools import reduce
 
 INPUT_FILE = "input.txt"
 
+# The version of the parsed form, see `advent_support.parse_cache`
+PARSER_VERSION = 1
+
 def parse_pairings(line):
     pairs = line.split(',')
 
@@ -24,26 +28,44 @@ def has_overlap(pairing):
     r1, r2 = pairing
     return r2[0] <= r1[0] <= r2[-1] or r1[0] <= r2[0] <= r1[-1]
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     # Materialize for parts 1 and 2
-    pairings = list(map(parse_pairings, lines))
+    return list(map(parse_pairings, lines))
+
+def encode_parsed(pairings):
+    # Every range packs to its inclusive start and end
+    return array('q', (bound for pairing in pairings for r in pairing for bound in (r[0], r[-1]))).tobytes()
+
+def decode_parsed(data):
+    bounds = array('q')
+    bounds.frombytes(data)
+
+    ranges = [range(s, e + 1) for s, e in zip(bounds[::2], bounds[1::2])]
+    return [ranges[i:i + 2] for i in range(0, len(ranges), 2)]
+
+def part1(pairings):
+    containments = map(has_full_containment, pairings)    
+    return reduce(lambda acc, b: acc + 1 if b else acc, containments, 0)
+
+def part2(pairings):
+    overlaps = map(has_overlap, pairings)
+    return reduce(lambda acc, b: acc + 1 if b else acc, overlaps, 0)
+
+def main():
+    pairings = parse(INPUT_FILE)
     
     #
     # Part 1
     #
-    containments = map(has_full_containment, pairings)    
-    n_containments = reduce(lambda acc, b: acc + 1 if b else acc, containments, 0)
-    print("Part 1:", n_containments)
+    print("Part 1:", part1(pairings))
 
     #
     # Part 2
     #
-    overlaps = map(has_overlap, pairings)
-    n_overlaps = reduce(lambda acc, b: acc + 1 if b else acc, overlaps, 0)
-    print("Part 2:", n_overlaps)
+    print("Part 2:", part2(pairings))
 
 if __name__ == "__main__":
     main()
@@ -4,8 +4,8 @@ from copy import deepcopy
 
 INPUT_FILE = "input.txt"
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     columns_dict = {}
@@ -39,9 +39,11 @@ def main():
         digits = re.compile(r'\d+')
         commands.append([int(d) for d in digits.findall(line)])
 
-    #
-    # Part 1
-    #
+    return columns, commands
+
+def part1(puzzle):
+    columns, commands = puzzle
+
     columns_cpy = deepcopy(columns)
     for move_n, _move_from, _move_to in commands:
         # Make the `move_from` and `move_to` 0-indexed
@@ -53,11 +55,11 @@ def main():
             crate = columns_cpy[move_from].popleft()
             columns_cpy[move_to].appendleft(crate)
 
-    print("Part 1:", ''.join(col[0] for col in columns_cpy))
+    return ''.join(col[0] for col in columns_cpy)
+
+def part2(puzzle):
+    columns, commands = puzzle
 
-    #
-    # Part 2
-    #
     columns_cpy = deepcopy(columns)
     for move_n, _move_from, _move_to in commands:
         # Make the `move_from` and `move_to` 0-indexed
@@ -70,7 +72,20 @@ def main():
         # The `extendleft` method results in the reversing of the iterable when placed in `columns_cpy`
         columns_cpy[move_to].extendleft(crates)
 
-    print("Part 2:", ''.join(col[0] for col in columns_cpy))
+    return ''.join(col[0] for col in columns_cpy)
+
+def main():
+    puzzle = parse(INPUT_FILE)
+
+    #
+    # Part 1
+    #
+    print("Part 1:", part1(puzzle))
+
+    #
+    # Part 2
+    #
+    print("Part 2:", part2(puzzle))
         
 if __name__ == "__main__":
     main()
@@ -27,12 +27,21 @@ def find_indicator_index(data, n_unique):
 
     return chars_processed
     
+def parse(path):
+    with open(path, 'r') as f:
+        return [c for c in f.read().rstrip()]
+
+def part1(data):
+    return find_indicator_index(data, 4)
+
+def part2(data):
+    return find_indicator_index(data, 14)
+
 def main():
-    with open(INPUT_FILE, 'r') as f:
-        data = [c for c in f.read().rstrip()]
+    data = parse(INPUT_FILE)
 
-    print("Part 1:", find_indicator_index(data, 4))
-    print("Part 2:", find_indicator_index(data, 14))
+    print("Part 1:", part1(data))
+    print("Part 2:", part2(data))
         
 if __name__ == "__main__":
     main()
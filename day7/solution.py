@@ -55,8 +55,8 @@ class Directory:
         else:
             raise ValueError(f"Directory not found: {directory}")
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     # Create a root directory
@@ -70,7 +70,6 @@ def main():
         cmd = line[2:4]
         if cmd == "cd":
             directory = line[5:]
-            print("CD", directory)            
 
             # Special case for non-relative `cd` to root
             if directory == "/":
@@ -83,7 +82,6 @@ def main():
                 if entry.startswith("$"):
                     break
                 entries.append(entry)
-            print("LS", entries)
                 
             # Return the consumed `entry` back to `lines`, if any value was read
             if entry is not None:
@@ -94,10 +92,9 @@ def main():
         else:
             raise ValueError(f"Unrecognized command: {cmd}")
 
-    #
-    # Part 1
-    #
+    return ROOT_DIR
 
+def part1(ROOT_DIR):
     # Traverse all directories from `ROOT_DIR` down and keep a running sum
     # of the sizes of all directories smaller than `THRESHOLD`
     THRESHOLD = 100_000
@@ -105,11 +102,9 @@ def main():
         rest = sum(map(lambda d: traverse(d), d.subdirs))
         return rest + (d.size if d.size <= THRESHOLD else 0)
 
-    print("Part 1: ", traverse(ROOT_DIR))
+    return traverse(ROOT_DIR)
 
-    #
-    # Part 2
-    #
+def part2(ROOT_DIR):
     CUR_FREE_SPACE = 70_000_000 - ROOT_DIR.size
     SPACE_NEEDED = 30_000_000 - CUR_FREE_SPACE
 
@@ -124,7 +119,20 @@ def main():
         return chain([d], chain.from_iterable(traverse(sd) for sd in d.subdirs))
 
     min_dir = min(traverse(ROOT_DIR))    
-    print("Part 2: ", min_dir.size)
+    return min_dir.size
+
+def main():
+    ROOT_DIR = parse(INPUT_FILE)
+
+    #
+    # Part 1
+    #
+    print("Part 1: ", part1(ROOT_DIR))
+
+    #
+    # Part 2
+    #
+    print("Part 2: ", part2(ROOT_DIR))
     
 if __name__ == "__main__":
     main()
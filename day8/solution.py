@@ -108,13 +108,8 @@ def calculate_tree_properties(grid, direction):
 
     return dir_properties_grid
 
-def main():
-    with open(INPUT_FILE, 'r') as f:
-        lines = map(lambda s: s.rstrip('\n'), f.readlines())
-
-    grid = Grid.from_list_grid([[int(c) for c in l] for l in lines])
-    len_x, len_y = grid.dimensions
-    
+def tree_properties(grid):
+    """Combine the directional properties of every tree of ``grid`` over all four directions."""
     # All trees begin as invisible until they are seen and have a neutral `scenic_score` of 1
     properties_grid = Grid.from_fill(*grid.dimensions, TreeProperty(is_visible=False, scenic_score=1))
     
@@ -125,17 +120,33 @@ def main():
         for tree, dir_property in zip(properties_grid, dir_properties_grid):
             tree.apply_directional_property(dir_property)
 
+    return properties_grid
+
+def parse(path):
+    # Imported upon parsing, so that merely importing the solution does not import NumPy
+    from advent_support import load_char_grid
+
+    with load_char_grid(path) as char_grid:
+        return Grid.from_list_grid(char_grid.digits().tolist())
+
+def part1(grid):
+    return sum(map(lambda t: int(t.is_visible), tree_properties(grid)))
+
+def part2(grid):
+    return max(map(lambda t: t.scenic_score, tree_properties(grid)))
+
+def main():
+    grid = parse(INPUT_FILE)
+
     #
     # Part 1
     #
-    n_invisible_trees = sum(map(lambda t: int(t.is_visible), properties_grid))
-    print("Part 1: ", n_invisible_trees)
+    print("Part 1: ", part1(grid))
 
     #
     # Part 2
     #
-    max_scenic_score = max(map(lambda t: t.scenic_score, properties_grid))
-    print("Part 2: ", max_scenic_score)    
+    print("Part 2: ", part2(grid))    
         
 if __name__ == "__main__":
     main()
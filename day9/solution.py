@@ -1,10 +1,17 @@
 import re
-import numpy
+from array import array
 from dataclasses import dataclass
 from enum import Enum
 
 INPUT_FILE = "input.txt"
 
+# The version of the parsed form, see `advent_support.parse_cache`
+PARSER_VERSION = 1
+
+def sign(v):
+    """The sign of the integer ``v``, as -1, 0 or 1."""
+    return (v > 0) - (v < 0)
+
 # Create a hashable dataclass with the extra arguments
 @dataclass(frozen=True)
 class Coordinates():
@@ -97,7 +104,7 @@ class UnboundedGrid():
         if abs(diff.x) > 1 or abs(diff.y) > 1:
             # Compute the vector of movement for the trailing knot. It is
             # the diagonal of the respective signs of `diff`
-            vector = Coordinates(numpy.sign(diff.x), numpy.sign(diff.y))
+            vector = Coordinates(sign(diff.x), sign(diff.y))
 
             # Recursively apply the `vector` with the trailing knot
             # being the head of this new movement
@@ -151,32 +158,55 @@ def parse_line(line):
     ret = re.match(r'([UDLR]) (\d+)', line)
     return Movement(Direction.from_string(ret.group(1)), int(ret.group(2)))
     
-def main():
-    with open(INPUT_FILE, 'r') as f:
+def parse(path):
+    with open(path, 'r') as f:
         lines = map(lambda s: s.rstrip('\n'), f.readlines())
 
     # Materialize for parts 1 and 2
-    moves = list(map(parse_line, lines))
+    return list(map(parse_line, lines))
 
-    #
-    # Part 1
-    #
+def encode_parsed(moves):
+    # Every move packs to the index of its direction and its number of steps
+    directions = list(Direction)
+    packed = array('q')
+    for move in moves:
+        packed.extend((directions.index(move.direction), move.nsteps))
+    return packed.tobytes()
+
+def decode_parsed(data):
+    directions = list(Direction)
+    packed = array('q')
+    packed.frombytes(data)
+    return [Movement(directions[d], nsteps) for d, nsteps in zip(packed[::2], packed[1::2])]
+
+def part1(moves):
     grid = UnboundedGrid(2)
     
     for move in moves:
         grid.apply_move(move)
         
-    print("Part 1: ", grid.n_visited)
+    return grid.n_visited
 
-    #
-    # Part 2
-    #
+def part2(moves):
     grid = UnboundedGrid(10)
     
     for move in moves:
         grid.apply_move(move)
 
-    print("Part 2: ", grid.n_visited)
+    return grid.n_visited
+
+def main():
+    moves = parse(INPUT_FILE)
+
+    #
+    # Part 1
+    #
+    print("Part 1: ", part1(moves))
+
+    #
+    # Part 2
+    #
+    print("Part 2: ", part2(moves))
         
 if __name__ == "__main__":
     main()